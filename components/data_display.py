@@ -3,20 +3,37 @@ Reusable data display components for the Stablecoin Dashboard.
 """
 
 # Standard library imports
-from typing import Any, Callable, Dict, List, Optional, Union
+import html
+import io
+from itertools import cycle
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 # Third-party imports
 import pandas as pd
-import plotly.graph_objects as go
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import streamlit as st
 
 # Local imports
+from utils.caching import dataframe_fingerprint
 from utils.style_guide import (
     DEFAULT_COLUMN_CONFIGS,
     get_dataframe_style_dict,
     get_default_plot_layout,
 )
 
+if TYPE_CHECKING:
+    # Plotly is only needed for annotations; callers pass figures they already built
+    import plotly.graph_objects as go
+
+# Streamlit alert functions keyed by display_info_alert's alert_type
+_ALERT_FUNCS: Dict[str, Callable[..., Any]] = {
+    "info": st.info,
+    "warning": st.warning,
+    "error": st.error,
+    "success": st.success,
+}
+
 
 def display_dataframe(
     df: pd.DataFrame,
@@ -25,10 +42,15 @@ def display_dataframe(
     hide_index: bool = True,
     height: Optional[int] = None,
     width: Optional[int] = None,
+    max_rows: int = 5000,
+    key: Optional[str] = None,
 ) -> None:
     """
     Display a DataFrame with consistent styling.
 
+    DataFrames longer than ``max_rows`` are shown one window at a time, with a slider to pick
+    the first row, so only that window is serialized on each rerun.
+
     Args:
         df: DataFrame to display
         column_config: Column configuration for the DataFrame
@@ -36,6 +58,8 @@ def display_dataframe(
         hide_index: Whether to hide the index
         height: Height of the DataFrame
         width: Width of the DataFrame
+        max_rows: Maximum number of rows sent to the frontend at once
+        key: Unique key for the row-window slider
     """
     # Get default styling
     style_dict = get_dataframe_style_dict()
@@ -54,18 +78,43 @@ def display_dataframe(
     if column_config is None:
         # Use default column configs for columns that exist in the DataFrame
         column_config = {
-            col: DEFAULT_COLUMN_CONFIGS.get(col, st.column_config.TextColumn(col))
-            for col in df.columns
-            if col in DEFAULT_COLUMN_CONFIGS
+            col: DEFAULT_COLUMN_CONFIGS[col]
+            for col in DEFAULT_COLUMN_CONFIGS.keys() & set(df.columns)
         }
 
     # Display the DataFrame
     if df.empty:
         st.warning("No data available to display.")
     else:
+        if len(df) > max_rows:
+            start_row = st.slider(
+                "Start row",
+                min_value=0,
+                max_value=len(df) - max_rows,
+                value=0,
+                key=key,
+                help=f"Showing {max_rows:,} of {len(df):,} rows",
+            )
+            df = df.iloc[start_row : start_row + max_rows]
+
         st.dataframe(df, column_config=column_config, **style_dict)
 
 
+def _escape_metric_text(value: Any) -> str:
+    """
+    Escape a metric label or value for the HTML metric grid.
+
+    Dollar signs are turned into entities so Streamlit's markdown does not render them as LaTeX.
+
+    Args:
+        value: Value to escape
+
+    Returns:
+        HTML-safe string
+    """
+    return html.escape(str(value)).replace("$", "&#36;")
+
+
 def display_metric_cards(
     metrics: Dict[str, Union[float, int, str]],
     columns: int = 3,
@@ -82,22 +131,30 @@ def display_metric_cards(
     if not metrics:
         return
 
-    cols = st.columns(columns)
+    # Static scalar metrics are rendered as one HTML grid instead of one element per metric
+    if format_func is None and all(isinstance(v, (int, float, str)) for v in metrics.values()):
+        cells = "".join(
+            f"<div><b>{_escape_metric_text(label)}</b><br>{_escape_metric_text(value)}</div>"
+            for label, value in metrics.items()
+        )
+        st.markdown(
+            f"<div class='metric-grid' style='display: grid; "
+            f"grid-template-columns: repeat({columns}, 1fr); gap: 1rem;'>{cells}</div>",
+            unsafe_allow_html=True,
+        )
+        return
 
-    for i, (label, value) in enumerate(metrics.items()):
-        col_idx = i % columns
+    fmt = format_func or {}
 
+    for (label, value), col in zip(metrics.items(), cycle(st.columns(columns))):
         # Apply formatting function if provided
-        if format_func and label in format_func:
-            formatted_value = format_func[label](value)
-        else:
-            formatted_value = value
+        formatted_value = fmt[label](value) if label in fmt else value
 
-        cols[col_idx].metric(label=label, value=formatted_value)
+        col.metric(label=label, value=formatted_value)
 
 
 def display_plotly_chart(
-    fig: go.Figure,
+    fig: "go.Figure",
     use_container_width: bool = True,
     title: Optional[str] = None,
     x_axis_title: Optional[str] = None,
@@ -117,7 +174,7 @@ def display_plotly_chart(
         height: Chart height
         show_legend: Whether to show the legend
     """
-    # Apply default layout for consistency
+    # Apply default layout for consistency; the layout dict itself is cached
     layout = get_default_plot_layout(
         title=title or fig.layout.title.text or "",
         x_axis_title=x_axis_title,
@@ -133,6 +190,44 @@ def display_plotly_chart(
     st.plotly_chart(fig, use_container_width=use_container_width)
 
 
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: dataframe_fingerprint})
+def _summary_stats(
+    df: pd.DataFrame, include_stats: bool = True
+) -> Tuple[List[str], Optional[pd.DataFrame]]:
+    """
+    Compute the numeric columns and descriptive statistics shown by display_data_summary.
+
+    Args:
+        df: DataFrame to summarize
+        include_stats: Whether to compute descriptive statistics
+
+    Returns:
+        Tuple of numeric column names and the transposed describe() table (None if not requested
+        or there are no numeric columns)
+    """
+    numeric_cols = [col for col, dtype in df.dtypes.items() if dtype.kind in "iuf"]
+
+    if not include_stats or not numeric_cols:
+        return numeric_cols, None
+
+    return numeric_cols, df[numeric_cols].describe().T
+
+
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: dataframe_fingerprint})
+def _col_sum(df: pd.DataFrame, col: str) -> float:
+    """
+    Sum a DataFrame column, cached per DataFrame content.
+
+    Args:
+        df: DataFrame containing the column
+        col: Name of the column to sum
+
+    Returns:
+        Column total
+    """
+    return float(df[col].sum())
+
+
 def display_data_summary(
     df: pd.DataFrame, title: str = "Data Summary", include_stats: bool = True
 ) -> None:
@@ -156,17 +251,16 @@ def display_data_summary(
     col2.metric("Total Columns", len(df.columns))
 
     # If specific columns exist, show their stats
-    numeric_cols = df.select_dtypes(include=["int", "float"]).columns
+    numeric_cols, stats_df = _summary_stats(df, include_stats)
 
     if "TVL_USD" in numeric_cols:
-        col3.metric("Total TVL", f"${df['TVL_USD'].sum():,.2f}")
+        col3.metric("Total TVL", f"${_col_sum(df, 'TVL_USD'):,.2f}")
     elif "TVL_Value" in numeric_cols:
-        col3.metric("Total TVL", f"${df['TVL_Value'].sum():,.2f}")
+        col3.metric("Total TVL", f"${_col_sum(df, 'TVL_Value'):,.2f}")
 
     # Include descriptive statistics if requested
-    if include_stats and len(numeric_cols) > 0:
+    if stats_df is not None:
         st.subheader("Descriptive Statistics")
-        stats_df = df[numeric_cols].describe().T
         display_dataframe(stats_df, hide_index=False)
 
 
@@ -178,16 +272,47 @@ def display_info_alert(message: str, alert_type: str = "info") -> None:
         message: Message to display
         alert_type: Type of alert ('info', 'warning', 'error', 'success')
     """
-    if alert_type == "info":
-        st.info(message)
-    elif alert_type == "warning":
-        st.warning(message)
-    elif alert_type == "error":
-        st.error(message)
-    elif alert_type == "success":
-        st.success(message)
-    else:
-        st.write(message)
+    _ALERT_FUNCS.get(alert_type, st.write)(message)
+
+
+def _iter_csv_chunks(df: pd.DataFrame, chunk_rows: int = 50_000) -> Iterator[bytes]:
+    """
+    Yield a DataFrame as UTF-8 CSV bytes, one block of rows at a time.
+
+    Args:
+        df: DataFrame to serialize
+        chunk_rows: Number of rows per block
+
+    Yields:
+        Encoded CSV blocks; only the first includes the header
+    """
+    for start in range(0, max(len(df), 1), chunk_rows):
+        yield df.iloc[start : start + chunk_rows].to_csv(index=False, header=start == 0).encode(
+            "utf-8"
+        )
+
+
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: dataframe_fingerprint})
+def _df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """
+    Serialize a DataFrame to CSV bytes, preferring the PyArrow writer.
+
+    Cached so reruns with an unchanged DataFrame reuse the serialized bytes. Both writers work
+    through the frame in row blocks, so no full-size intermediate string is built.
+
+    Args:
+        df: DataFrame to serialize
+
+    Returns:
+        UTF-8 encoded CSV content
+    """
+    try:
+        buffer = io.BytesIO()
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buffer)
+        return buffer.getvalue()
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # Mixed-type object columns cannot always be converted; use the pandas writer
+        return b"".join(_iter_csv_chunks(df))
 
 
 def display_data_download(
@@ -211,14 +336,14 @@ def display_data_download(
         st.warning("No data available to download.")
         return
 
-    # Convert DataFrame to CSV
-    csv = df.to_csv(index=False)
+    # Convert DataFrame to CSV bytes (download_button accepts bytes directly)
+    csv = _df_to_csv_bytes(df)
 
     # Create download button
     st.download_button(label=label, data=csv, file_name=filename, mime=mime, help=help_text)
 
 
-def create_tabs(tab_names: List[str]) -> List[st.tab]:
+def create_tabs(tab_names: List[str]) -> List[Any]:
     """
     Create a set of tabs.
 
@@ -6,7 +6,10 @@ Reusable filter components for the Stablecoin Dashboard.
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Third-party imports
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import streamlit as st
 
 # Local imports
@@ -159,48 +162,183 @@ def filter_dataframe(df: pd.DataFrame, filters: Dict[str, Dict[str, Any]]) -> pd
     if df.empty:
         return df
 
-    filtered_df = df.copy()
+    # Accumulate every filter into one row mask and slice the DataFrame once at the end
+    mask = np.ones(len(df), dtype=bool)
+
+    # Default ">=" numeric filters are fused into a single pass before the rest
+    min_value_filters = [
+        (column, filter_config["value"])
+        for column, filter_config in filters.items()
+        if _is_fusable_numeric_filter(df, column, filter_config)
+    ]
+    if min_value_filters:
+        mask &= _min_value_mask(df, min_value_filters)
+    fused_columns = {column for column, _ in min_value_filters}
 
     for column, filter_config in filters.items():
-        if column not in filtered_df.columns:
+        if column not in df.columns:
             st.warning(f"Column '{column}' not found in DataFrame, skipping filter")
             continue
 
         filter_type = filter_config.get("type", "text")
         filter_value = filter_config.get("value")
 
-        # Skip if no filter value is provided
+        # Skip if no filter value is provided or the filter was already fused
         if filter_value is None or (isinstance(filter_value, str) and filter_value == ""):
             continue
+        if column in fused_columns:
+            continue
 
         if filter_type == "text":
             case_sensitive = filter_config.get("case_sensitive", False)
 
-            if case_sensitive:
-                condition = filtered_df[column].astype(str).str.contains(filter_value)
-            else:
-                condition = (
-                    filtered_df[column]
-                    .astype(str)
-                    .str.lower()
-                    .str.contains(str(filter_value).lower())
-                )
+            # Only search rows that are still selected by the previous filters
+            candidate_rows = np.flatnonzero(mask)
 
-            filtered_df = filtered_df[condition]
+            matches = _text_mask(df[column].iloc[candidate_rows], str(filter_value), case_sensitive)
+            mask[candidate_rows[~matches]] = False
 
         elif filter_type == "numeric":
             condition_func = filter_config.get("condition", lambda col, val: col >= val)
-            condition = condition_func(filtered_df[column], filter_value)
-            filtered_df = filtered_df[condition]
+            condition = condition_func(df[column], filter_value)
+            mask &= _to_bool_array(condition)
 
         elif filter_type == "select":
             if isinstance(filter_value, list):
                 if len(filter_value) > 0 and filter_value[0] != "All":
-                    filtered_df = filtered_df[filtered_df[column].isin(filter_value)]
+                    mask &= _select_mask(df[column], filter_value)
             elif filter_value != "All":
-                filtered_df = filtered_df[filtered_df[column] == filter_value]
+                if isinstance(df[column].dtype, pd.CategoricalDtype):
+                    mask &= _select_mask(df[column], [filter_value])
+                else:
+                    mask &= _to_bool_array(df[column] == filter_value)
+
+    return df.loc[mask]
+
+
+def _is_fusable_numeric_filter(
+    df: pd.DataFrame, column: str, filter_config: Dict[str, Any]
+) -> bool:
+    """
+    Check whether a filter is a default ">=" numeric filter on a NumPy numeric column.
+
+    Args:
+        df: DataFrame being filtered
+        column: Column the filter applies to
+        filter_config: Filter configuration
+
+    Returns:
+        True if the filter can be evaluated by _min_value_mask
+    """
+    filter_value = filter_config.get("value")
+    return (
+        filter_config.get("type", "text") == "numeric"
+        and "condition" not in filter_config
+        and column in df.columns
+        and isinstance(filter_value, (int, float))
+        and not isinstance(filter_value, bool)
+        and isinstance(df[column].dtype, np.dtype)
+        and df[column].dtype.kind in "iuf"
+    )
+
+
+def _min_value_mask(df: pd.DataFrame, min_value_filters: List[Tuple[str, Any]]) -> np.ndarray:
+    """
+    Evaluate several ``column >= value`` filters into a single mask.
+
+    Accumulates NumPy comparisons through a single reused scratch buffer, so no intermediate
+    mask is allocated per filter.
+
+    Args:
+        df: DataFrame being filtered
+        min_value_filters: List of (column, minimum value) pairs
+
+    Returns:
+        NumPy boolean array marking rows that satisfy every filter
+    """
+    mask = np.ones(len(df), dtype=bool)
+    scratch = np.empty(len(df), dtype=bool)
+    for column, value in min_value_filters:
+        np.greater_equal(df[column].to_numpy(), value, out=scratch)
+        mask &= scratch
+    return mask
+
 
-    return filtered_df
+def _text_mask(values: pd.Series, pattern: str, case_sensitive: bool) -> np.ndarray:
+    """
+    Build a literal substring-match mask for a text filter.
+
+    Categorical columns are searched once per distinct category and the result is mapped back
+    through the codes; other columns are searched with Arrow's match_substring kernel, without
+    copying string and object columns first.
+
+    Args:
+        values: Column to search
+        pattern: Substring to look for
+        case_sensitive: Whether the match is case-sensitive
+
+    Returns:
+        NumPy boolean array marking matching rows (missing values never match)
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = values.cat.categories.astype("string[pyarrow]")
+        category_matches = np.asarray(
+            categories.str.contains(pattern, case=case_sensitive, regex=False, na=False),
+            dtype=bool,
+        )
+        codes = values.cat.codes.to_numpy()
+        return np.where(codes >= 0, category_matches[codes], False)
+
+    # String and object columns are handed to Arrow as-is; anything else is converted once
+    strings = None
+    if values.dtype == object or pd.api.types.is_string_dtype(values.dtype):
+        try:
+            strings = pa.array(values, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            strings = None
+        if strings is not None and not (
+            pa.types.is_string(strings.type) or pa.types.is_large_string(strings.type)
+        ):
+            strings = None
+    if strings is None:
+        strings = pa.array(values.astype("string[pyarrow]"))
+
+    matches = pc.match_substring(strings, pattern, ignore_case=not case_sensitive)
+    return pc.fill_null(matches, False).to_numpy(zero_copy_only=False)
+
+
+def _select_mask(values: pd.Series, selected: List[Any]) -> np.ndarray:
+    """
+    Build a membership mask for a select filter, comparing category codes for categoricals.
+
+    Args:
+        values: Column to filter
+        selected: Values to keep
+
+    Returns:
+        NumPy boolean array marking rows whose value is in ``selected``
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Map the selected values to their integer codes once and scan the codes array
+        wanted_codes = values.cat.categories.get_indexer(selected)
+        return np.isin(values.cat.codes.to_numpy(), wanted_codes[wanted_codes >= 0])
+
+    return values.isin(selected).to_numpy()
+
+
+def _to_bool_array(condition: Any) -> np.ndarray:
+    """
+    Convert a filter condition to a plain NumPy boolean array, treating missing values as False.
+
+    Args:
+        condition: Boolean Series or array-like returned by a filter condition
+
+    Returns:
+        NumPy boolean array
+    """
+    if isinstance(condition, pd.Series):
+        return condition.fillna(False).to_numpy(dtype=bool)
+    return np.asarray(condition, dtype=bool)
 
 
 def create_filter_section(
@@ -2,6 +2,7 @@
 Sidebar components for the Stablecoin Dashboard.
 """
 
+import functools
 import logging
 import os
 from typing import Any, Callable, Dict, List, Optional, Tuple
@@ -11,6 +12,35 @@ import streamlit as st
 from utils.config import LOGO_PATH
 
 
+@functools.lru_cache(maxsize=4)
+def _resolve_logo(logo_path: str) -> Optional[str]:
+    """
+    Return the logo path if the file exists, caching the check across reruns.
+
+    Args:
+        logo_path: Path to the logo image
+
+    Returns:
+        The logo path, or None if the file does not exist
+    """
+    return logo_path if os.path.exists(logo_path) else None
+
+
+@st.cache_resource(show_spinner=False)
+def _load_logo_bytes(logo_path: str) -> bytes:
+    """
+    Read the logo image once and keep its bytes in memory.
+
+    Args:
+        logo_path: Path to the logo image
+
+    Returns:
+        Raw image bytes
+    """
+    with open(logo_path, "rb") as logo_file:
+        return logo_file.read()
+
+
 def create_sidebar(
     title: str = "Izun Dashboard",
     navigation_options: Optional[List[str]] = None,
@@ -33,9 +63,9 @@ def create_sidebar(
         # Display logo if available
         logo_path = logo_path or LOGO_PATH
 
-        if logo_path and os.path.exists(logo_path):
+        if logo_path and _resolve_logo(logo_path):
             try:
-                st.image(logo_path)
+                st.image(_load_logo_bytes(logo_path))
             except Exception as e:
                 st.warning(f"Could not display logo image: {e}")
                 logging.warning(f"Failed to display logo: {e}")
@@ -13,17 +13,19 @@ from typing import Dict, List, Optional
 import pandas as pd
 import streamlit as st
 
-# Page imports
+# Page imports (the analytics pages are imported in their branches below so Plotly Express
+# is only loaded once a chart page is opened)
 from pages.overview import show_overview
-from pages.pool_yield_analytics import show_pool_yield_analytics
 from pages.pool_yields import show_pool_yields
-from pages.stablecoin_analytics import show_stablecoin_analytics
 from pages.stablecoin_yields import show_stablecoin_yields
 
 # Local imports
 from utils.config import CONTACT_INFO, DEFAULT_NAVIGATION_OPTIONS, LOGO_PATH, TITLE
 from utils.style_guide import apply_ui_theme
 
+# Copy-on-Write lets filtered selections share data until they are modified
+pd.set_option("mode.copy_on_write", True)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
@@ -71,10 +73,14 @@ def main() -> None:
     elif choice == "Stablecoin Yields":
         show_stablecoin_yields()
     elif choice == "Stablecoin Analytics":
+        from pages.stablecoin_analytics import show_stablecoin_analytics
+
         show_stablecoin_analytics()
     elif choice == "Pool Yields":
         show_pool_yields()
     elif choice == "Pool Yield Analytics":
+        from pages.pool_yield_analytics import show_pool_yield_analytics
+
         show_pool_yield_analytics()
 
 
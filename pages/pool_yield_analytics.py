@@ -4,12 +4,12 @@ Pool Yield Analytics page of the dashboard.
 
 import logging
 
-import pandas as pd
 import streamlit as st
 
-from utils.api import get_stablecoin_metadata
-from utils.config import DEFAULT_MIN_TVL_USD, TARGET_YIELD_ASSET_SYMBOLS_LOWER
+from utils.api import load_defillama_tables
+from utils.config import DEFAULT_MIN_TVL_USD, TARGET_YIELD_ASSET_SYMBOLS_LOWER_SET
 from utils.data_processing import get_analytics_data
+from utils.error_handling import get_dataframe_status
 from utils.formatting import format_tvl
 from utils.visualization import (
     create_apy_distribution_histogram,
@@ -26,8 +26,8 @@ def show_pool_yield_analytics():
         "Visualizations based on the broader stablecoin and yield-asset pool data from API (Default TVL > $10M)."
     )
 
-    # Get stablecoin metadata for joining
-    stablecoin_metadata_api = get_stablecoin_metadata()
+    # Load stablecoin metadata for joining alongside the yield pools
+    stablecoin_metadata_api, yield_pools_api = load_defillama_tables()
 
     # Use default TVL filter for analytics
     analytics_min_tvl_api = DEFAULT_MIN_TVL_USD
@@ -35,14 +35,15 @@ def show_pool_yield_analytics():
 
     # Get analytics data
     analytics_data_api = get_analytics_data(
-        analytics_min_tvl_api, TARGET_YIELD_ASSET_SYMBOLS_LOWER, stablecoin_metadata_api
+        analytics_min_tvl_api,
+        TARGET_YIELD_ASSET_SYMBOLS_LOWER_SET,
+        stablecoin_metadata_api,
+        yield_pools_api,
     )
 
     # Check if data is valid
-    data_valid_analytics_api = not (
-        isinstance(analytics_data_api, pd.DataFrame)
-        and any(col in analytics_data_api.columns for col in ["error", "warning", "warning_tvl"])
-    )
+    analytics_status_api = get_dataframe_status(analytics_data_api)
+    data_valid_analytics_api = analytics_status_api is None
 
     if data_valid_analytics_api and not analytics_data_api.empty:
         # APY Distribution
@@ -110,18 +111,16 @@ def show_pool_yield_analytics():
             st.warning(f"Pool Analytics: Could not generate Top Projects by TVL plot: {e}")
 
     # Handle error states
-    elif isinstance(analytics_data_api, pd.DataFrame) and "error" in analytics_data_api.columns:
+    elif analytics_status_api == "error":
         st.error(
             f"Pool Analytics: Failed to fetch or process API data - {analytics_data_api['error'].iloc[0]}"
         )
-    elif isinstance(analytics_data_api, pd.DataFrame) and (
-        "warning" in analytics_data_api.columns or "warning_tvl" in analytics_data_api.columns
-    ):
-        if "warning" in analytics_data_api.columns:
+    elif analytics_status_api in ("warning", "warning_tvl"):
+        if analytics_status_api == "warning":
             st.warning(
                 f"Pool Analytics: {analytics_data_api['warning'].iloc[0]}. No API pools matched base criteria."
             )
-        elif "warning_tvl" in analytics_data_api.columns:
+        else:
             st.warning(
                 f"Pool Analytics: {analytics_data_api['warning_tvl'].iloc[0]}. No API pools matched TVL criteria."
             )
@@ -4,33 +4,53 @@ Pool Yields page of the dashboard.
 
 import logging
 from datetime import datetime
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+import numpy as np
 import pandas as pd
-import pytz
 import streamlit as st
 
-from utils.api import get_stablecoin_metadata
-from utils.config import DEFAULT_MIN_TVL_USD, TARGET_YIELD_ASSET_SYMBOLS_LOWER
-from utils.data_processing import get_yield_data
+from utils.api import load_defillama_tables
+from utils.config import DEFAULT_MIN_TVL_USD, TARGET_YIELD_ASSET_SYMBOLS_LOWER_SET
+from utils.data_processing import get_yield_data, get_yield_filter_options
+from utils.error_handling import get_dataframe_status
 from utils.formatting import format_tvl
 
+# Resolve the refresh-timestamp zone once at import instead of on every rerun
+try:
+    LONDON_TZ = ZoneInfo("Europe/London")
+except ZoneInfoNotFoundError:
+    LONDON_TZ = None
+
 
 def show_pool_yields():
     """Display the pool yields page with DeFiLlama data."""
     st.title("Pool Yields")
 
     # Get the current time in London timezone for refresh timestamp
-    try:
-        london_time = datetime.now(pytz.timezone("Europe/London"))
-        refresh_time_str = london_time.strftime("%Y-%m-%d %H:%M:%S %Z")
-    except Exception:
+    if LONDON_TZ is not None:
+        refresh_time_str = datetime.now(LONDON_TZ).strftime("%Y-%m-%d %H:%M:%S %Z")
+    else:
         refresh_time_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     st.caption(f"Data sourced from DeFiLlama | Last Refreshed: {refresh_time_str}")
 
-    # Get stablecoin metadata for joining
-    stablecoin_metadata = get_stablecoin_metadata()
+    # Load stablecoin metadata for joining alongside the yield pools
+    stablecoin_metadata, yield_pools = load_defillama_tables()
+
+    # Filters and table rerun as a fragment, so widget changes skip the rest of the app
+    _show_pool_yields_table(stablecoin_metadata, yield_pools)
 
+
+@st.fragment
+def _show_pool_yields_table(stablecoin_metadata, yield_pools):
+    """
+    Display the pool yields filters and table.
+
+    Args:
+        stablecoin_metadata: DataFrame with stablecoin metadata for joining
+        yield_pools: DataFrame with the yield pools, or None if the fetch failed
+    """
     # Create filter UI
     st.subheader("Filters")
     col1, col2, col3, col4 = st.columns([1, 1.5, 1.5, 1.5])
@@ -49,7 +69,7 @@ def show_pool_yields():
 
     # Get initial data with minimum TVL filter
     initial_yield_data = get_yield_data(
-        min_tvl_input, TARGET_YIELD_ASSET_SYMBOLS_LOWER, stablecoin_metadata
+        min_tvl_input, TARGET_YIELD_ASSET_SYMBOLS_LOWER_SET, stablecoin_metadata, yield_pools
     )
 
     # Initialize filter variables
@@ -60,18 +80,20 @@ def show_pool_yields():
     filter_symbol_search = ""
 
     # Check if data is valid
-    data_valid = not (
-        isinstance(initial_yield_data, pd.DataFrame)
-        and any(col in initial_yield_data.columns for col in ["error", "warning", "warning_tvl"])
-    )
+    data_status = get_dataframe_status(initial_yield_data)
+    data_valid = data_status is None
 
     # Prepare filter options if data is valid
     if data_valid and not initial_yield_data.empty:
         try:
-            if "Project" in initial_yield_data.columns:
-                options_projects.extend(sorted(initial_yield_data["Project"].dropna().unique()))
-            if "Type (Peg)" in initial_yield_data.columns:
-                options_types.extend(sorted(initial_yield_data["Type (Peg)"].dropna().unique()))
+            filter_options = get_yield_filter_options(
+                min_tvl_input,
+                TARGET_YIELD_ASSET_SYMBOLS_LOWER_SET,
+                stablecoin_metadata,
+                yield_pools,
+            )
+            options_projects.extend(filter_options.get("Project", []))
+            options_types.extend(filter_options.get("Type (Peg)", []))
         except KeyError as e:
             st.error(f"Pool Yields: Expected column missing for filter options: {e}")
             data_valid = False
@@ -111,15 +133,24 @@ def show_pool_yields():
     # Filter the data based on user selections
     filtered_yield_data = pd.DataFrame()
     if data_valid and not initial_yield_data.empty:
-        filtered_yield_data = initial_yield_data.copy()
+        filtered_yield_data = initial_yield_data
         try:
+            # Combine all filters into one mask and slice the frame once
+            mask = np.ones(len(filtered_yield_data), dtype=bool)
+
             if filter_symbol_search:
-                if "Asset Symbol" in filtered_yield_data.columns:
-                    filtered_yield_data = filtered_yield_data[
+                if "_symbol_lc" in filtered_yield_data.columns:
+                    mask &= (
+                        filtered_yield_data["_symbol_lc"]
+                        .str.contains(filter_symbol_search.lower(), regex=False, na=False)
+                        .to_numpy(dtype=bool)
+                    )
+                elif "Asset Symbol" in filtered_yield_data.columns:
+                    mask &= (
                         filtered_yield_data["Asset Symbol"]
-                        .str.lower()
-                        .str.contains(filter_symbol_search.lower())
-                    ]
+                        .str.contains(filter_symbol_search, case=False, regex=False, na=False)
+                        .to_numpy(dtype=bool)
+                    )
                 else:
                     st.warning(
                         "Pool Yields: Cannot filter by symbol: 'Asset Symbol' column missing."
@@ -127,20 +158,19 @@ def show_pool_yields():
 
             if selected_projects:
                 if "Project" in filtered_yield_data.columns:
-                    filtered_yield_data = filtered_yield_data[
-                        filtered_yield_data["Project"].isin(selected_projects)
-                    ]
+                    mask &= filtered_yield_data["Project"].isin(selected_projects).to_numpy()
                 else:
                     st.warning("Pool Yields: Cannot filter by project: 'Project' column missing.")
 
             if selected_types:
                 if "Type (Peg)" in filtered_yield_data.columns:
-                    filtered_yield_data = filtered_yield_data[
-                        filtered_yield_data["Type (Peg)"].isin(selected_types)
-                    ]
+                    mask &= filtered_yield_data["Type (Peg)"].isin(selected_types).to_numpy()
                 else:
                     st.warning("Pool Yields: Cannot filter by type: 'Type (Peg)' column missing.")
 
+            if not mask.all():
+                filtered_yield_data = filtered_yield_data[mask]
+
         except KeyError as e:
             st.error(f"Pool Yields: Error applying filters: Column '{e}' not found.")
             filtered_yield_data = pd.DataFrame()
@@ -152,17 +182,15 @@ def show_pool_yields():
     st.divider()
 
     # Handle error states
-    if isinstance(initial_yield_data, pd.DataFrame) and "error" in initial_yield_data.columns:
+    if data_status == "error":
         st.error(
             f"Pool Yields Data fetching failed: {initial_yield_data['error'].iloc[0]}. Please try again later."
         )
-    elif isinstance(initial_yield_data, pd.DataFrame) and "warning" in initial_yield_data.columns:
+    elif data_status == "warning":
         st.warning(
             f"Pool Yields Initial data load issue: {initial_yield_data['warning'].iloc[0]}. No pools matched the base criteria from API."
         )
-    elif (
-        isinstance(initial_yield_data, pd.DataFrame) and "warning_tvl" in initial_yield_data.columns
-    ):
+    elif data_status == "warning_tvl":
         st.warning(
             f"Pool Yields Initial data load issue: {initial_yield_data['warning_tvl'].iloc[0]}. No pools found matching API criteria with TVL > {format_tvl(min_tvl_input)}."
         )
@@ -192,11 +220,11 @@ def show_pool_yields():
         ]
 
         column_config = {
-            "TVL (USD)": st.column_config.TextColumn(
-                "TVL (USD)", help="Total Value Locked (Formatted)"
+            "TVL (USD)": st.column_config.NumberColumn(
+                "TVL (USD)", help="Total Value Locked in USD", format="dollar"
             ),
-            "APY (%)": st.column_config.TextColumn(
-                "APY (%)", help="Annual Percentage Yield (Formatted)"
+            "APY (%)": st.column_config.NumberColumn(
+                "APY (%)", help="Annual Percentage Yield", format="%.2f%%"
             ),
             "Issuer/Name": st.column_config.TextColumn(
                 "Issuer/Name", help="Issuing project or name (from metadata)"
@@ -4,11 +4,11 @@ Stablecoin Analytics page of the dashboard.
 
 import logging
 
-import pandas as pd
 import streamlit as st
 
 from utils.config import MANUAL_STABLECOIN_DATA
-from utils.data_processing import get_enhanced_analytics_data
+from utils.data_processing import get_enhanced_analytics_data, get_strategy_aggregates
+from utils.error_handling import get_dataframe_status
 from utils.visualization import (
     create_avg_yield_by_strategy_plot,
     create_strategy_distribution_pie,
@@ -26,12 +26,13 @@ def show_stablecoin_analytics():
     enhanced_analytics_data = get_enhanced_analytics_data(MANUAL_STABLECOIN_DATA)
 
     # Check if data is valid
-    data_valid = not (
-        isinstance(enhanced_analytics_data, pd.DataFrame)
-        and any(col in enhanced_analytics_data.columns for col in ["error", "warning"])
-    )
+    data_status = get_dataframe_status(enhanced_analytics_data)
+    data_valid = data_status is None
 
     if data_valid and not enhanced_analytics_data.empty:
+        # Per-strategy counts and average APY, grouped once in the cached loader
+        strategy_agg = get_strategy_aggregates(MANUAL_STABLECOIN_DATA)
+
         # Top Stablecoins by Yield
         st.subheader("Top Stablecoins by Yield")
         try:
@@ -58,7 +59,10 @@ def show_stablecoin_analytics():
         st.subheader("Distribution by Strategy Type")
         try:
             if "Strategy Type" in enhanced_analytics_data.columns:
-                fig_strategy_pie = create_strategy_distribution_pie(enhanced_analytics_data)
+                fig_strategy_pie = create_strategy_distribution_pie(
+                    enhanced_analytics_data,
+                    strategy_agg=strategy_agg,
+                )
                 st.plotly_chart(fig_strategy_pie, use_container_width=True)
             else:
                 st.warning("Strategy Type information not available for distribution plot.")
@@ -74,7 +78,10 @@ def show_stablecoin_analytics():
                 "Strategy Type" in enhanced_analytics_data.columns
                 and "APY" in enhanced_analytics_data.columns
             ):
-                fig_strategy_yield = create_avg_yield_by_strategy_plot(enhanced_analytics_data)
+                fig_strategy_yield = create_avg_yield_by_strategy_plot(
+                    enhanced_analytics_data,
+                    strategy_agg=strategy_agg,
+                )
                 st.plotly_chart(fig_strategy_yield, use_container_width=True)
             else:
                 st.warning("Strategy Type or APY information not available for average yield plot.")
@@ -107,17 +114,11 @@ def show_stablecoin_analytics():
             logging.error(f"Error in Stablecoin Analytics TVL vs APY plot: {e}")
 
     # Handle error states
-    elif (
-        isinstance(enhanced_analytics_data, pd.DataFrame)
-        and "error" in enhanced_analytics_data.columns
-    ):
+    elif data_status == "error":
         st.error(
             f"Stablecoin Analytics: Failed to process data - {enhanced_analytics_data['error'].iloc[0]}"
         )
-    elif (
-        isinstance(enhanced_analytics_data, pd.DataFrame)
-        and "warning" in enhanced_analytics_data.columns
-    ):
+    elif data_status == "warning":
         st.warning(f"Stablecoin Analytics: {enhanced_analytics_data['warning'].iloc[0]}")
         st.warning("Analytics may be incomplete.")
     else:
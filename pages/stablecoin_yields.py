@@ -5,11 +5,16 @@ Stablecoin Yields page of the dashboard.
 import logging
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 from utils.config import MANUAL_STABLECOIN_DATA
-from utils.data_processing import get_stablecoin_yields_data
+from utils.data_processing import (
+    get_stablecoin_yields_data,
+    get_stablecoin_yields_filter_options,
+)
+from utils.error_handling import get_dataframe_status
 from utils.formatting import categorize_stablecoin_by_strategy
 
 
@@ -21,28 +26,42 @@ def show_stablecoin_yields():
     # Get the stablecoin yield data
     stablecoin_yield_data = get_stablecoin_yields_data(MANUAL_STABLECOIN_DATA)
 
+    # Filters and table rerun as a fragment, so widget changes skip the rest of the app
+    _show_stablecoin_yields_table(stablecoin_yield_data)
+
+
+@st.fragment
+def _show_stablecoin_yields_table(stablecoin_yield_data):
+    """
+    Display the stablecoin yields filters and table.
+
+    Args:
+        stablecoin_yield_data: DataFrame returned by get_stablecoin_yields_data
+    """
     # Check if data is valid
-    data_valid = not (
-        isinstance(stablecoin_yield_data, pd.DataFrame)
-        and ("error" in stablecoin_yield_data.columns or "warning" in stablecoin_yield_data.columns)
-    )
+    data_status = get_dataframe_status(stablecoin_yield_data)
+    data_valid = data_status is None
 
     filtered_data = pd.DataFrame()
     options_projects = ["All"]
     options_strategy = ["All"]
 
     if data_valid and not stablecoin_yield_data.empty:
-        filtered_data = stablecoin_yield_data.copy()
+        # The cached loader hands out a fresh frame per call, so no defensive copy is needed
+        filtered_data = stablecoin_yield_data
 
-        # Add strategy type column for filtering
-        filtered_data["Strategy Type"] = filtered_data["Description"].apply(
-            categorize_stablecoin_by_strategy
-        )
+        # Strategy type is precomputed by the cached loader; derive it only if missing
+        if "Strategy Type" not in filtered_data.columns and "Description" in filtered_data.columns:
+            filtered_data["Strategy Type"] = filtered_data["Description"].apply(
+                categorize_stablecoin_by_strategy
+            )
 
-        # Get list of projects and strategies for filters
-        if "Project" in filtered_data.columns:
-            options_projects.extend(sorted(filtered_data["Project"].dropna().unique()))
-        if "Strategy Type" in filtered_data.columns:
+        # Get list of projects and strategies for filters, collected once per data load
+        filter_options = get_stablecoin_yields_filter_options(MANUAL_STABLECOIN_DATA)
+        options_projects.extend(filter_options.get("Project", []))
+        if "Strategy Type" in filter_options:
+            options_strategy.extend(filter_options["Strategy Type"])
+        elif "Strategy Type" in filtered_data.columns:
             options_strategy.extend(sorted(filtered_data["Strategy Type"].dropna().unique()))
 
         # Create filters UI
@@ -69,36 +88,44 @@ def show_stablecoin_yields():
                 key="stable_yields_strategy_filter",
             )
 
-        # Apply filters
+        # Apply filters as one combined mask and slice the frame once
+        mask = np.ones(len(filtered_data), dtype=bool)
+
         if filter_ticker:
-            if "Ticker" in filtered_data.columns:
-                filtered_data = filtered_data[
-                    filtered_data["Ticker"].str.lower().str.contains(filter_ticker.lower())
-                ]
+            if "_ticker_lc" in filtered_data.columns:
+                mask &= (
+                    filtered_data["_ticker_lc"]
+                    .str.contains(filter_ticker.lower(), regex=False, na=False)
+                    .to_numpy(dtype=bool)
+                )
+            elif "Ticker" in filtered_data.columns:
+                mask &= (
+                    filtered_data["Ticker"]
+                    .str.contains(filter_ticker, case=False, regex=False, na=False)
+                    .to_numpy(dtype=bool)
+                )
             else:
                 st.error("Filtering failed: 'Ticker' column not found.")
 
         if filter_project != "All":
             if "Project" in filtered_data.columns:
-                filtered_data = filtered_data[filtered_data["Project"] == filter_project]
+                mask &= (filtered_data["Project"] == filter_project).to_numpy(dtype=bool)
             else:
                 st.warning("Cannot filter by project: 'Project' column missing.")
 
         if filter_strategy != "All":
             if "Strategy Type" in filtered_data.columns:
-                filtered_data = filtered_data[filtered_data["Strategy Type"] == filter_strategy]
+                mask &= (filtered_data["Strategy Type"] == filter_strategy).to_numpy(dtype=bool)
             else:
                 st.warning("Cannot filter by strategy: 'Strategy Type' column missing.")
 
+        if not mask.all():
+            filtered_data = filtered_data[mask]
+
     # Handle error states
-    elif (
-        isinstance(stablecoin_yield_data, pd.DataFrame) and "error" in stablecoin_yield_data.columns
-    ):
+    elif data_status == "error":
         st.error(f"Failed to load stablecoin yield data: {stablecoin_yield_data['error'].iloc[0]}")
-    elif (
-        isinstance(stablecoin_yield_data, pd.DataFrame)
-        and "warning" in stablecoin_yield_data.columns
-    ):
+    elif data_status == "warning":
         st.warning(
             f"Could not load all stablecoin yield data: {stablecoin_yield_data['warning'].iloc[0]}"
         )
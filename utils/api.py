@@ -5,15 +5,23 @@ API utility functions for fetching data from external sources.
 # Standard library imports
 import json
 import logging
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 # Third-party imports
 import pandas as pd
+import pyarrow as pa
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 
 # Local imports
+from utils.caching import LOAD_STAMP_ATTR
 from utils.config import (
     API_DELAY,
     API_RETRIES,
@@ -32,6 +40,7 @@ from utils.error_handling import create_error_dataframe, handle_api_error
 from utils.security import (
     InvalidURLError,
     RateLimitExceededError,
+    SecurityError,
     ValidationError,
     rate_limit_request,
     sanitize_url,
@@ -39,9 +48,112 @@ from utils.security import (
     validate_api_response,
 )
 
+T = TypeVar("T")
+
 # Rate limiting storage
 RATE_LIMIT_STORE: Dict[str, Dict[str, int]] = {}
 
+# Yield pool columns the rest of the app relies on, with defaults for missing ones
+POOL_REQUIRED_COLUMNS: Dict[str, Any] = {
+    "stablecoin": False,
+    "symbol": "",
+    "tvlUsd": pd.NA,
+    "apy": pd.NA,
+    "project": "Unknown",
+    "chain": "Unknown",
+}
+POOL_NUMERIC_COLUMNS = ["tvlUsd", "apy"]
+
+# Arrow schemas for the JSON fields that are read; every other field in the payloads is skipped
+POOL_ARROW_SCHEMA = pa.schema(
+    [
+        ("chain", pa.string()),
+        ("project", pa.string()),
+        ("symbol", pa.string()),
+        ("tvlUsd", pa.float64()),
+        ("apy", pa.float64()),
+        ("stablecoin", pa.bool_()),
+    ]
+)
+METADATA_ARROW_SCHEMA = pa.schema(
+    [
+        ("symbol", pa.string()),
+        ("name", pa.string()),
+        ("pegMechanism", pa.string()),
+        ("pegType", pa.string()),
+    ]
+)
+
+# Decode JSON responses with orjson when available (much faster on the large pools payload)
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+@st.cache_resource(show_spinner=False)
+def _http_session(retries: int, delay: int) -> requests.Session:
+    """
+    Returns a shared HTTP session whose adapter retries transient failures.
+
+    Connections are pooled per session, so retries and back-to-back calls to the same host
+    reuse the TCP/TLS connection. Failed attempts back off exponentially with jitter, capped at
+    ``delay`` seconds. Responses are requested compressed with every encoding urllib3 can decode
+    here (brotli/zstd too when their packages are installed).
+
+    Args:
+        retries: Total number of attempts per request
+        delay: Maximum delay between attempts in seconds
+
+    Returns:
+        Configured requests Session
+    """
+    retry = Retry(
+        total=max(retries - 1, 0),
+        backoff_factor=0.5,
+        backoff_max=delay,
+        backoff_jitter=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+    )
+    session = requests.Session()
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    session.mount("https://", HTTPAdapter(max_retries=retry, pool_connections=4, pool_maxsize=8))
+    return session
+
+
+def _records_to_dataframe(records: List[Dict[str, Any]], schema: pa.Schema) -> pd.DataFrame:
+    """
+    Builds a DataFrame with only the schema's columns from a list of JSON records.
+
+    Arrow converts the records column by column against the fixed schema, so fields outside it
+    never become per-cell Python objects. Fields missing from every record are left out, as
+    they would be with pd.DataFrame(records). Records that do not match the schema types fall
+    back to pandas.
+
+    Args:
+        records: List of JSON objects
+        schema: Arrow schema of the fields to keep
+
+    Returns:
+        DataFrame with the schema's columns present in the records
+    """
+    try:
+        table = pa.Table.from_pylist(records, schema=schema)
+        present = [
+            name
+            for name, column in zip(table.column_names, table.columns)
+            if column.null_count < table.num_rows
+        ]
+        return table.select(present).to_pandas()
+
+    except (pa.ArrowException, TypeError) as e:
+        logging.info(f"Falling back to pandas for records that do not match the schema: {e}")
+        df = pd.DataFrame(records)
+        return df[[col for col in schema.names if col in df.columns]]
+
 
 def fetch_data_with_retries(
     url: str,
@@ -56,18 +168,21 @@ def fetch_data_with_retries(
     """
     Generic function to fetch data from an API with retry logic and proper error handling.
 
+    Retries of connection errors, timeouts and retryable status codes are handled by the
+    session's urllib3 Retry policy.
+
     Args:
         url: The API endpoint URL
         timeout: Request timeout in seconds
-        retries: Number of retry attempts
-        delay: Delay between retries in seconds
+        retries: Number of attempts
+        delay: Maximum delay between attempts in seconds
         error_message: Custom error message prefix
         expected_keys: List of keys expected in the response
         api_key: Optional API key for authenticated requests
         api_secret: Optional API secret for signed requests
 
     Returns:
-        JSON response as dict or None if all requests fail
+        JSON response as dict or None if the request fails
 
     Raises:
         Various SecurityError subclasses that are caught and handled
@@ -90,102 +205,76 @@ def fetch_data_with_retries(
         handle_api_error(e, f"Security error when preparing request to {url}", logging.ERROR)
         return None
 
-    attempt = 0
-    last_error = None
+    try:
+        response = _http_session(retries, delay).get(url, timeout=timeout, headers=headers)
+        response.raise_for_status()  # Raises HTTPError for bad responses
 
-    while attempt < retries:
-        try:
-            response = requests.get(url, timeout=timeout, headers=headers)
-            response.raise_for_status()  # Raises HTTPError for bad responses
-
-            # Parse the response
-            response_data = response.json()
-
-            # Validate the response structure
-            validate_api_response(response_data, expected_keys)
-
-            return response_data
-
-        except ValidationError as e:
-            # Validation errors are likely to be consistent across retries,
-            # but we might try again in case it was a transient issue
-            attempt += 1
-            last_error = e
-            logging.warning(f"API response validation failed (Attempt {attempt}/{retries}): {e}")
-
-            if attempt < retries:
-                st.warning(f"Invalid API response format. Retrying in {delay}s...")
-                time.sleep(delay)
-            else:
-                handle_api_error(
-                    e,
-                    f"Failed to validate response from {url} after {retries} attempts",
-                    logging.ERROR,
-                )
-                return None
-
-        except requests.exceptions.RequestException as e:
-            # Network or HTTP errors might be transient
-            attempt += 1
-            last_error = e
-            logging.warning(f"{error_message} (Attempt {attempt}/{retries}): {e}")
-
-            if attempt < retries:
-                st.warning(f"Request failed. Retrying in {delay}s...")
-                time.sleep(delay)
-            else:
-                handle_api_error(
-                    e, f"Failed to fetch data from {url} after {retries} attempts", logging.ERROR
-                )
-                return None
-
-        except json.JSONDecodeError as e:
-            # JSON parsing errors usually indicate bad response data
-            attempt += 1
-            last_error = e
-            logging.warning(f"JSON parsing error (Attempt {attempt}/{retries}): {e}")
-
-            if attempt < retries:
-                st.warning(f"Invalid JSON response. Retrying in {delay}s...")
-                time.sleep(delay)
-            else:
-                handle_api_error(
-                    e, f"Failed to parse JSON from {url} after {retries} attempts", logging.ERROR
-                )
-                return None
-
-        except Exception as e:
-            # Catch any other unexpected errors
-            attempt += 1
-            last_error = e
-            logging.error(f"Unexpected error (Attempt {attempt}/{retries}): {e}")
-
-            if attempt < retries:
-                st.warning(f"Unexpected error occurred. Retrying in {delay}s...")
-                time.sleep(delay)
-            else:
-                handle_api_error(
-                    e,
-                    f"Unexpected error when fetching data from {url}",
-                    logging.ERROR,
-                    show_traceback=True,
-                )
-                return None
-
-    # If we reach here, all retries failed but we might not have raised a final error
-    if last_error:
+        # Parse the response
+        response_data = _json_loads(response.content)
+
+        # Validate the response structure
+        validate_api_response(response_data, expected_keys)
+
+        return response_data
+
+    except ValidationError as e:
+        handle_api_error(e, f"Failed to validate response from {url}", logging.ERROR)
+
+    except json.JSONDecodeError as e:
+        # JSON parsing errors usually indicate bad response data
+        handle_api_error(e, f"Failed to parse JSON from {url}", logging.ERROR)
+
+    except requests.exceptions.RequestException as e:
+        # Network or HTTP errors that persisted through every retry
+        logging.warning(f"{error_message}: {e}")
         handle_api_error(
-            last_error, f"Failed to fetch data from {url} after {retries} attempts", logging.ERROR
+            e, f"Failed to fetch data from {url} after {retries} attempts", logging.ERROR
+        )
+
+    except Exception as e:
+        # Catch any other unexpected errors
+        handle_api_error(
+            e,
+            f"Unexpected error when fetching data from {url}",
+            logging.ERROR,
+            show_traceback=True,
         )
 
     return None
 
 
-@st.cache_data(ttl=CACHE_TTL_LONG)
+def run_concurrently(calls: List[Callable[[], T]]) -> List[T]:
+    """
+    Run several zero-argument callables concurrently.
+
+    Each call runs on its own worker thread attached to the current Streamlit script run,
+    so retry warnings, errors and cached loaders behave as they do on the main thread.
+
+    Args:
+        calls: Callables to run
+
+    Returns:
+        Results in the same order as calls
+    """
+    script_run_ctx = get_script_run_ctx()
+
+    def run(call: Callable[[], T]) -> T:
+        if script_run_ctx is not None:
+            add_script_run_ctx(threading.current_thread(), script_run_ctx)
+        return call()
+
+    with ThreadPoolExecutor(max_workers=max(len(calls), 1)) as executor:
+        return list(executor.map(run, calls))
+
+
+@st.cache_resource(ttl=CACHE_TTL_LONG)
 def get_stablecoin_metadata(retries: int = API_RETRIES, delay: int = API_DELAY) -> pd.DataFrame:
     """
     Fetches stablecoin metadata from DefiLlama API with caching.
 
+    The DataFrame is a shared, read-only reference table: it is cached as a resource so every
+    session reuses the same object instead of unpickling a copy. Callers must not modify it.
+
     Args:
         retries: Number of retry attempts
         delay: Delay between retries in seconds
@@ -208,11 +297,15 @@ def get_stablecoin_metadata(retries: int = API_RETRIES, delay: int = API_DELAY)
         return pd.DataFrame()
 
     try:
-        meta_df = pd.DataFrame(data["peggedAssets"])
-        cols_to_keep = ["symbol", "name", "pegMechanism", "pegType"]
-        meta_df = meta_df[[col for col in cols_to_keep if col in meta_df.columns]].copy()
+        meta_df = _records_to_dataframe(data["peggedAssets"], METADATA_ARROW_SCHEMA)
+        # Lowercased once here, Arrow-backed like the pools' join_symbol it is merged on
+        meta_df["symbol"] = meta_df["symbol"].astype("string[pyarrow]")
         meta_df["join_symbol"] = meta_df["symbol"].str.lower()
 
+        # Stamp the shared frame so loaders taking it as an argument can key their caches on
+        # the stamp rather than hashing its contents on every call
+        meta_df.attrs[LOAD_STAMP_ATTR] = time.time_ns()
+
         return meta_df
 
     except Exception as e:
@@ -222,13 +315,17 @@ def get_stablecoin_metadata(retries: int = API_RETRIES, delay: int = API_DELAY)
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=CACHE_TTL_MEDIUM)
+@st.cache_resource(ttl=CACHE_TTL_MEDIUM)
 def fetch_defillama_yield_pools(
     retries: int = API_RETRIES, delay: int = API_DELAY
 ) -> Optional[pd.DataFrame]:
     """
     Fetches and performs initial processing of yield pool data from DefiLlama.
 
+    Like the stablecoin metadata, the DataFrame is cached as a shared resource so callers get
+    the cached object itself rather than an unpickled copy of the full pool table. Callers
+    must not modify it.
+
     Args:
         retries: Number of retry attempts
         delay: Delay between retries in seconds
@@ -254,54 +351,84 @@ def fetch_defillama_yield_pools(
         return None
 
     try:
-        df = pd.DataFrame(data["data"])
+        df = _records_to_dataframe(data["data"], POOL_ARROW_SCHEMA)
         logging.info(f"Initial pool count: {len(df)}")
 
-        # Ensure required columns exist and have proper types
-        required_columns = {
-            "stablecoin": False,
-            "symbol": "",
-            "tvlUsd": pd.NA,
-            "apy": pd.NA,
-            "project": "Unknown",
-            "chain": "Unknown",
+        # Add missing required columns with default values in one step
+        missing_columns = {
+            col: default for col, default in POOL_REQUIRED_COLUMNS.items() if col not in df.columns
         }
-
-        # Add missing columns with default values
-        for col, default in required_columns.items():
-            if col not in df.columns:
-                df[col] = default
+        if missing_columns:
+            df = df.assign(**missing_columns)
 
         # Convert column types appropriately with defensive error handling
         try:
-            df["stablecoin"] = (
-                pd.to_numeric(df["stablecoin"], errors="coerce").fillna(0).astype(bool)
-            )
+            # JSON booleans usually arrive as a bool column already; only coerce otherwise
+            if df["stablecoin"].dtype != bool:
+                try:
+                    df["stablecoin"] = df["stablecoin"].astype("boolean").fillna(False).astype(bool)
+                except TypeError:
+                    df["stablecoin"] = (
+                        pd.to_numeric(df["stablecoin"], errors="coerce").fillna(0).astype(bool)
+                    )
         except Exception:
             logging.warning("Error converting 'stablecoin' column to boolean, using default False")
             df["stablecoin"] = False
 
-        df["symbol"] = df["symbol"].astype(str)
-        df["project"] = df["project"].astype(str)
-        df["chain"] = df["chain"].astype(str)
-
-        try:
-            df["tvlUsd"] = pd.to_numeric(df["tvlUsd"], errors="coerce")
-        except Exception:
-            logging.warning("Error converting 'tvlUsd' column to numeric, using NaN")
-            df["tvlUsd"] = pd.NA
+        # Arrow-backed strings so lowercasing and isin run as vectorized Arrow kernels
+        df["symbol"] = df["symbol"].astype("string[pyarrow]")
+        # Few distinct projects and chains across thousands of pools: store them as categoricals
+        df[["project", "chain"]] = df[["project", "chain"]].astype(str).astype("category")
 
+        # Numeric columns are downcast to float32 when pandas finds no significant precision loss
         try:
-            df["apy"] = pd.to_numeric(df["apy"], errors="coerce")
+            df[POOL_NUMERIC_COLUMNS] = df[POOL_NUMERIC_COLUMNS].apply(
+                pd.to_numeric, errors="coerce", downcast="float"
+            )
         except Exception:
-            logging.warning("Error converting 'apy' column to numeric, using NaN")
-            df["apy"] = pd.NA
+            logging.warning(
+                f"Error converting {POOL_NUMERIC_COLUMNS} columns to numeric, using NaN"
+            )
+            df[POOL_NUMERIC_COLUMNS] = pd.NA
 
         df["join_symbol"] = df["symbol"].str.lower()
 
+        # Sort once here so the filtered slices taken downstream are already ordered by APY
+        df = df.sort_values("apy", ascending=False, na_position="last", kind="stable")
+        df = df.reset_index(drop=True)
+
+        # Stamp each load so the derived caches that take this frame are keyed on it and
+        # expire with it
+        df.attrs[LOAD_STAMP_ATTR] = time.time_ns()
+
         return df
 
     except Exception as e:
         error_msg = "Error processing yield pool data"
         handle_api_error(e, error_msg, logging.ERROR, show_traceback=True)
         return None
+
+
+def load_defillama_tables(
+    retries: int = API_RETRIES, delay: int = API_DELAY
+) -> Tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+    """
+    Loads the stablecoin metadata and yield pool tables concurrently.
+
+    Each table keeps its own cache and TTL; when both are cold, a page load waits for the
+    slower of the two requests instead of both in turn.
+
+    Args:
+        retries: Number of retry attempts
+        delay: Delay between retries in seconds
+
+    Returns:
+        Tuple of (stablecoin metadata DataFrame, yield pool DataFrame or None on error)
+    """
+    metadata_df, pools_df = run_concurrently(
+        [
+            lambda: get_stablecoin_metadata(retries, delay),
+            lambda: fetch_defillama_yield_pools(retries, delay),
+        ]
+    )
+    return metadata_df, pools_df
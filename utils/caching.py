@@ -44,6 +44,58 @@ def generate_cache_key(*args: Any, **kwargs: Any) -> str:
     return key
 
 
+def dataframe_fingerprint(df: pd.DataFrame) -> Tuple[Any, ...]:
+    """
+    Compute a content-based fingerprint of a DataFrame for use as a cache key.
+
+    Intended for ``st.cache_data(hash_funcs={pd.DataFrame: dataframe_fingerprint})``
+    so hashing is a single vectorized pass instead of a pickle deep-walk.
+
+    Args:
+        df: DataFrame to fingerprint
+
+    Returns:
+        Tuple of shape, column names, dtypes and a digest of the values
+    """
+    try:
+        values_bytes = pd.util.hash_pandas_object(df, index=False).values.tobytes()
+    except TypeError:
+        # Unhashable cells (e.g. lists) cannot go through hash_pandas_object
+        values_bytes = df.to_csv(index=False).encode()
+
+    return (
+        df.shape,
+        tuple(df.columns),
+        tuple(str(dtype) for dtype in df.dtypes),
+        hashlib.md5(values_bytes).hexdigest(),
+    )
+
+
+# DataFrame.attrs key under which a cached loader stamps the shared frame it returns
+LOAD_STAMP_ATTR = "load_stamp"
+
+
+def stamped_dataframe_key(df: pd.DataFrame) -> Tuple[Any, ...]:
+    """
+    Cache key for a DataFrame argument that is a shared resource stamped by its loader.
+
+    Intended for ``st.cache_data(hash_funcs={pd.DataFrame: stamped_dataframe_key})`` on
+    functions that take such a frame (the stablecoin metadata or yield pools), so each lookup
+    reads the stamp instead of hashing the values. Unstamped frames fall back to dataframe_fingerprint.
+
+    Args:
+        df: DataFrame to key
+
+    Returns:
+        Tuple of the load stamp and shape, or the content fingerprint
+    """
+    stamp = df.attrs.get(LOAD_STAMP_ATTR)
+    if stamp is None:
+        return dataframe_fingerprint(df)
+
+    return (LOAD_STAMP_ATTR, stamp, df.shape, tuple(df.columns))
+
+
 def memory_cache(ttl: float = CACHE_TTL_SHORT) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     Custom in-memory cache decorator with TTL.
@@ -2,7 +2,7 @@
 Configuration and constants for the dashboard.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, List
 
 # API endpoints
 DEFILLAMA_YIELDS_API_URL = "https://yields.llama.fi/pools"
@@ -30,6 +30,10 @@ LOGO_PATH = "izun_partners_logo.jpeg"
 TITLE = "Izun Stablecoin Dashboard"
 CONTACT_INFO = "team@izun.io"
 
+# Chart settings
+SCATTER_BINNING_THRESHOLD = 1500  # Above this many points the TVL vs APY plot is binned
+SCATTER_BINS = (60, 40)  # (log TVL, APY) bins for the binned TVL vs APY plot
+
 # Navigation
 DEFAULT_NAVIGATION_OPTIONS = [
     "Overview",
@@ -77,6 +81,9 @@ TARGET_YIELD_ASSET_SYMBOLS_LOWER: List[str] = [
     "usd0",
 ]
 
+# Set form of the target symbols for membership tests
+TARGET_YIELD_ASSET_SYMBOLS_LOWER_SET: FrozenSet[str] = frozenset(TARGET_YIELD_ASSET_SYMBOLS_LOWER)
+
 # Manually entered stablecoin data
 MANUAL_STABLECOIN_DATA: Dict[str, Dict[str, str]] = {
     "susdf": {
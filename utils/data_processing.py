@@ -3,125 +3,148 @@ Data processing utilities for the stablecoin dashboard.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Collection, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 import streamlit as st
 
-from utils.api import fetch_defillama_yield_pools
-from utils.caching import batch_process_dataframe, optimize_dataframe, parallel_apply
-from utils.error_handling import create_error_dataframe, handle_api_error
+from utils.caching import (
+    dataframe_fingerprint,
+    optimize_dataframe,
+    parallel_apply,
+    stamped_dataframe_key,
+)
+from utils.config import CACHE_TTL_MEDIUM
+from utils.error_handling import create_error_dataframe, get_dataframe_status, handle_api_error
 from utils.formatting import (
     categorize_stablecoin_by_strategy,
-    format_apy,
-    format_metadata,
+    format_metadata_series,
     format_staked_proportion,
     format_tvl,
-    parse_tvl,
-    parse_yield,
+    parse_tvl_series,
+    parse_yield_series,
 )
 
 # Constants
 DEFAULT_MIN_TVL_USD = 10_000_000
 
 
-def get_yield_data(
+@st.cache_resource(
+    ttl=CACHE_TTL_MEDIUM,
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: stamped_dataframe_key},
+)
+def get_filtered_pools(
     min_tvl: float,
-    target_yield_assets_lower: List[str],
+    target_yield_assets_lower: Tuple[str, ...],
     stablecoin_metadata_df: Optional[pd.DataFrame],
+    yield_pools_df: Optional[pd.DataFrame],
 ) -> pd.DataFrame:
     """
-    Processes yield pool data for the Pool Yields table, filtering, merging metadata, and formatting.
+    Filters yield pools to stablecoin and target-asset pools above the TVL threshold and merges
+    stablecoin metadata, keeping the original numeric columns.
+
+    Shared by get_yield_data and get_analytics_data so both pages reuse one filtered frame. It
+    is cached as a resource, so switching between the two pages hands back the same object
+    without unpickling a copy. The cache is keyed on the load stamps of the frames passed in,
+    so a new pool load is picked up on the next call.
+
+    Callers must not mutate the returned frame in place (no ``inplace=True`` calls or
+    ``.loc``/``.iloc`` assignment on it). Only the Copy-on-Write option set in main.py keeps
+    derived frames from writing through to the shared object.
 
     Args:
         min_tvl: Minimum TVL filter value
-        target_yield_assets_lower: List of target yield asset symbols in lowercase
+        target_yield_assets_lower: Sorted tuple of target yield asset symbols in lowercase
         stablecoin_metadata_df: DataFrame with stablecoin metadata
+        yield_pools_df: DataFrame from fetch_defillama_yield_pools, or None if the fetch failed
 
     Returns:
-        DataFrame with processed yield data for display
+        DataFrame with the filtered pools, or an error DataFrame (see get_dataframe_status)
     """
-    base_df = fetch_defillama_yield_pools()
-
-    # Early return cases
-    error_return = create_error_dataframe("error", "Data fetch failed")
-    warning_return = create_error_dataframe("warning", "No pools matched base criteria")
-    warning_tvl_return = create_error_dataframe(
-        "warning_tvl", f"No pools matched TVL > {format_tvl(min_tvl)}"
-    )
+    base_df = yield_pools_df
 
     if base_df is None:
-        logging.error("get_yield_data: Base DF fetch failed.")
-        return error_return
+        logging.error("get_filtered_pools: Base DF fetch failed.")
+        return create_error_dataframe("error", "Data fetch failed")
 
     if base_df.empty:
         st.warning("Yield Pool API returned no data.")
-        logging.warning("get_yield_data: Base DF is empty.")
-        return warning_return
+        logging.warning("get_filtered_pools: Base DF is empty.")
+        return create_error_dataframe("warning", "No pools matched base criteria")
 
     try:
-        # Filter for stablecoins and target assets
-        condition_is_stablecoin_flag = base_df["stablecoin"] == True
-        condition_is_target_yield_asset = base_df["join_symbol"].isin(target_yield_assets_lower)
-        relevant_pools_df = base_df[
-            condition_is_stablecoin_flag | condition_is_target_yield_asset
-        ].copy()
+        # Filter for stablecoins and target assets on plain NumPy masks
+        condition_is_stablecoin_flag = base_df["stablecoin"].to_numpy(dtype=bool)
+        condition_is_target_yield_asset = (
+            base_df["join_symbol"].isin(target_yield_assets_lower).to_numpy(dtype=bool)
+        )
+        relevant_mask = condition_is_stablecoin_flag | condition_is_target_yield_asset
+        relevant_count = int(relevant_mask.sum())
 
         logging.info(
-            f"Pool Yields: Pool count after filtering for stablecoin flag or target asset: {len(relevant_pools_df)}"
+            f"Pools: Pool count after filtering for stablecoin flag or target asset: {relevant_count}"
         )
 
-        if relevant_pools_df.empty:
-            logging.warning("get_yield_data: No relevant pools after stablecoin/target filter.")
-            return warning_return
+        if relevant_count == 0:
+            logging.warning("get_filtered_pools: No relevant pools after stablecoin/target filter.")
+            return create_error_dataframe("warning", "No pools matched base criteria")
 
-        # Apply TVL filter
-        tvl_condition = relevant_pools_df["tvlUsd"].fillna(0) > min_tvl
-        filtered_tvl_df = relevant_pools_df[tvl_condition].copy()
+        # Apply TVL filter to the same mask and select the surviving rows once. The comparison
+        # runs on the raw float column (NaN never exceeds the non-negative threshold, so no
+        # fillna copy is needed)
+        tvl_values = base_df["tvlUsd"].to_numpy()
+        if tvl_values.dtype.kind != "f":
+            tvl_values = base_df["tvlUsd"].to_numpy(dtype=float, na_value=np.nan)
+        tvl_condition = tvl_values > min_tvl
+        filtered_tvl_df = base_df[relevant_mask & tvl_condition]
+        min_tvl_str = format_tvl(min_tvl)
 
         logging.info(
-            f"Pool Yields: Pool count after TVL filter (> {format_tvl(min_tvl)}): {len(filtered_tvl_df)}"
+            f"Pools: Pool count after TVL filter (> {min_tvl_str}): {len(filtered_tvl_df)}"
         )
 
         if filtered_tvl_df.empty:
             logging.warning(
-                f"get_yield_data: No relevant pools found with TVL > {format_tvl(min_tvl)}."
+                f"get_filtered_pools: No relevant pools found with TVL > {min_tvl_str}."
             )
-            return warning_tvl_return
+            return create_error_dataframe("warning_tvl", f"No pools matched TVL > {min_tvl_str}")
 
         # Merge with stablecoin metadata if available
         merged_df = filtered_tvl_df
         if stablecoin_metadata_df is not None and not stablecoin_metadata_df.empty:
-            if (
-                "join_symbol" not in stablecoin_metadata_df.columns
-                and "symbol" in stablecoin_metadata_df.columns
-            ):
-                stablecoin_metadata_df["join_symbol"] = stablecoin_metadata_df["symbol"].str.lower()
-
+            # join_symbol is built once by get_stablecoin_metadata
             if "join_symbol" in stablecoin_metadata_df.columns:
                 meta_cols_to_merge = ["join_symbol", "name", "pegMechanism", "pegType"]
                 meta_subset = stablecoin_metadata_df[
                     [col for col in meta_cols_to_merge if col in stablecoin_metadata_df.columns]
                 ].drop_duplicates(subset=["join_symbol"])
 
-                merged_df = pd.merge(
-                    filtered_tvl_df,
-                    meta_subset,
-                    on="join_symbol",
-                    how="left",
-                    suffixes=("", "_meta"),
+                # Metadata is small and unique per symbol, so gather its rows by label instead
+                # of building a hash join; pool columns win over same-named metadata columns
+                meta_lookup = meta_subset.set_index("join_symbol")
+                meta_lookup = meta_lookup[
+                    [col for col in meta_lookup.columns if col not in filtered_tvl_df.columns]
+                ]
+                meta_rows = meta_lookup.reindex(filtered_tvl_df["join_symbol"])
+
+                merged_df = pd.concat(
+                    [
+                        filtered_tvl_df.reset_index(drop=True),
+                        meta_rows.reset_index(drop=True),
+                    ],
+                    axis=1,
                 )
-                logging.info("Pool Yields: Merged stablecoin metadata.")
+                logging.info("Pools: Merged stablecoin metadata.")
             else:
                 logging.warning(
-                    "get_yield_data: Stablecoin metadata missing join_symbol, merge skipped."
+                    "get_filtered_pools: Stablecoin metadata missing join_symbol, merge skipped."
                 )
         else:
-            logging.warning("get_yield_data: Stablecoin metadata is None or empty, merge skipped.")
-            for col in ["name", "pegMechanism", "pegType"]:
-                if col not in merged_df.columns:
-                    merged_df[col] = None
+            logging.warning(
+                "get_filtered_pools: Stablecoin metadata is None or empty, merge skipped."
+            )
 
         # Ensure all required columns exist
         for col in [
@@ -137,6 +160,38 @@ def get_yield_data(
             if col not in merged_df.columns:
                 merged_df[col] = None
 
+        return merged_df
+
+    except Exception as e:
+        handle_api_error(e, "Error filtering yield pools", logging.ERROR, show_traceback=True)
+        return create_error_dataframe("error", "Data fetch failed")
+
+
+def get_yield_data(
+    min_tvl: float,
+    target_yield_assets_lower: Collection[str],
+    stablecoin_metadata_df: Optional[pd.DataFrame],
+    yield_pools_df: Optional[pd.DataFrame],
+) -> pd.DataFrame:
+    """
+    Processes yield pool data for the Pool Yields table, filtering, merging metadata, and formatting.
+
+    Args:
+        min_tvl: Minimum TVL filter value
+        target_yield_assets_lower: Collection of target yield asset symbols in lowercase
+        stablecoin_metadata_df: DataFrame with stablecoin metadata
+        yield_pools_df: DataFrame with the yield pools
+
+    Returns:
+        DataFrame with processed yield data for display
+    """
+    merged_df = get_filtered_pools(
+        min_tvl, tuple(sorted(target_yield_assets_lower)), stablecoin_metadata_df, yield_pools_df
+    )
+    if get_dataframe_status(merged_df) is not None:
+        return merged_df
+
+    try:
         # Rename columns for display
         rename_mapping = {
             "chain": "Chain",
@@ -150,20 +205,13 @@ def get_yield_data(
         }
         final_df = merged_df.rename(columns=rename_mapping)
 
-        # Store numeric values for sorting and format display values
-        if "TVL (USD)" in final_df.columns:
-            final_df["TVL_Value"] = final_df["TVL (USD)"]
-            final_df["TVL (USD)"] = final_df["TVL (USD)"].apply(format_tvl)
-        else:
-            final_df["TVL_Value"] = pd.NA
+        # Pools arrive sorted by APY from fetch_defillama_yield_pools and the filter keeps
+        # that order, so no sort is needed here
 
-        if "APY (%)" in final_df.columns:
-            final_df["apy_sort_col"] = final_df["APY (%)"]
-            final_df["APY (%)"] = final_df["APY (%)"].apply(format_apy)
-        else:
-            final_df["apy_sort_col"] = pd.NA
+        # TVL (USD) and APY (%) stay numeric; the page formats them through NumberColumn so
+        # the table sorts by value and no per-row string formatting is needed
 
-        # Format metadata columns in batches for better performance
+        # Format metadata columns with one vectorized mask per column
         metadata_cols = [
             "Issuer/Name",
             "Type (Peg Mechanism)",
@@ -174,14 +222,7 @@ def get_yield_data(
         ]
         for col in metadata_cols:
             if col in final_df.columns:
-                final_df[col] = parallel_apply(final_df, format_metadata, col)
-
-        # Sort by APY
-        if "apy_sort_col" in final_df.columns:
-            final_df = final_df.sort_values(by="apy_sort_col", ascending=False, na_position="last")
-            final_df = final_df.drop(columns=["apy_sort_col"])
-        else:
-            logging.warning("get_yield_data: Could not sort by APY, sort column missing.")
+                final_df[col] = format_metadata_series(final_df[col])
 
         # Select display columns
         display_columns_yield = [
@@ -197,10 +238,18 @@ def get_yield_data(
             if col not in final_df.columns:
                 final_df[col] = "N/A"
 
-        final_display_df = final_df[display_columns_yield]
+        # Hidden lowercased symbol for the page's "contains" filter, Arrow-backed so the
+        # literal match runs in Arrow's substring kernel
+        final_display_df = final_df[display_columns_yield].assign(
+            _symbol_lc=final_df["Asset Symbol"].astype("string[pyarrow]").str.lower()
+        )
 
-        # Optimize memory usage
+        # Optimize memory usage; the filter columns are always categorical so option lists and
+        # isin filters work on the category codes
         final_display_df = optimize_dataframe(final_display_df)
+        final_display_df = final_display_df.astype(
+            {"Chain": "category", "Project": "category", "Type (Peg)": "category"}
+        )
 
         logging.info(f"get_yield_data: Returning {len(final_display_df)} rows for display.")
 
@@ -208,124 +257,39 @@ def get_yield_data(
 
     except Exception as e:
         handle_api_error(e, "Error processing yield data", logging.ERROR, show_traceback=True)
-        return error_return
+        return create_error_dataframe("error", "Data fetch failed")
 
 
+@st.cache_data(
+    ttl=CACHE_TTL_MEDIUM,
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: stamped_dataframe_key},
+)
 def get_analytics_data(
     min_tvl: float,
-    target_yield_assets_lower: List[str],
+    target_yield_assets_lower: Collection[str],
     stablecoin_metadata_df: Optional[pd.DataFrame],
+    yield_pools_df: Optional[pd.DataFrame],
 ) -> pd.DataFrame:
     """
     Prepares data for Pool Yield Analytics (e.g., charts), keeping numeric values.
 
     Args:
         min_tvl: Minimum TVL filter value
-        target_yield_assets_lower: List of target yield asset symbols in lowercase
+        target_yield_assets_lower: Collection of target yield asset symbols in lowercase
         stablecoin_metadata_df: DataFrame with stablecoin metadata
+        yield_pools_df: DataFrame with the yield pools
 
     Returns:
         DataFrame with processed data for analytics
     """
-    base_df = fetch_defillama_yield_pools()
-
-    # Early return cases
-    error_return = create_error_dataframe("error", "Data fetch failed")
-    warning_return = create_error_dataframe("warning", "No pools matched base criteria")
-    warning_tvl_return = create_error_dataframe(
-        "warning_tvl", f"No pools matched TVL > {format_tvl(min_tvl)}"
+    merged_df = get_filtered_pools(
+        min_tvl, tuple(sorted(target_yield_assets_lower)), stablecoin_metadata_df, yield_pools_df
     )
-
-    if base_df is None:
-        logging.error("get_analytics_data: Base DF fetch failed.")
-        return error_return
-
-    if base_df.empty:
-        st.warning("Yield Pool API returned no data for analytics.")
-        logging.warning("get_analytics_data: Base DF is empty.")
-        return warning_return
+    if get_dataframe_status(merged_df) is not None:
+        return merged_df
 
     try:
-        # Filter for stablecoins and target assets
-        condition_is_stablecoin_flag = base_df["stablecoin"] == True
-        condition_is_target_yield_asset = base_df["join_symbol"].isin(target_yield_assets_lower)
-        relevant_pools_df = base_df[
-            condition_is_stablecoin_flag | condition_is_target_yield_asset
-        ].copy()
-
-        logging.info(
-            f"Pool Analytics data: Pool count after filtering for stablecoin flag or target asset: {len(relevant_pools_df)}"
-        )
-
-        if relevant_pools_df.empty:
-            logging.warning("get_analytics_data: No relevant pools after stablecoin/target filter.")
-            return warning_return
-
-        # Apply TVL filter
-        tvl_condition = relevant_pools_df["tvlUsd"].fillna(0) > min_tvl
-        filtered_tvl_df = relevant_pools_df[tvl_condition].copy()
-
-        logging.info(
-            f"Pool Analytics data: Pool count after TVL filter (> {format_tvl(min_tvl)}): {len(filtered_tvl_df)}"
-        )
-
-        if filtered_tvl_df.empty:
-            logging.warning(
-                f"get_analytics_data: No relevant pools found with TVL > {format_tvl(min_tvl)}."
-            )
-            return warning_tvl_return
-
-        # Merge with stablecoin metadata if available
-        merged_df = filtered_tvl_df
-        if stablecoin_metadata_df is not None and not stablecoin_metadata_df.empty:
-            if (
-                "join_symbol" not in stablecoin_metadata_df.columns
-                and "symbol" in stablecoin_metadata_df.columns
-            ):
-                stablecoin_metadata_df["join_symbol"] = stablecoin_metadata_df["symbol"].str.lower()
-
-            if "join_symbol" in stablecoin_metadata_df.columns:
-                meta_cols_to_merge = ["join_symbol", "name", "pegMechanism", "pegType"]
-                meta_subset = stablecoin_metadata_df[
-                    [col for col in meta_cols_to_merge if col in stablecoin_metadata_df.columns]
-                ].drop_duplicates(subset=["join_symbol"])
-
-                merged_df = pd.merge(
-                    filtered_tvl_df,
-                    meta_subset,
-                    on="join_symbol",
-                    how="left",
-                    suffixes=("", "_meta"),
-                )
-                logging.info("Pool Analytics data: Merged stablecoin metadata.")
-            else:
-                merged_df = filtered_tvl_df
-                logging.warning(
-                    "get_analytics_data: Stablecoin metadata missing join_symbol, merge skipped."
-                )
-        else:
-            merged_df = filtered_tvl_df
-            logging.warning(
-                "get_analytics_data: Stablecoin metadata is None or empty, merge skipped."
-            )
-            for col in ["name", "pegMechanism", "pegType"]:
-                if col not in merged_df.columns:
-                    merged_df[col] = None
-
-        # Ensure all required columns exist
-        for col in [
-            "chain",
-            "project",
-            "symbol",
-            "tvlUsd",
-            "apy",
-            "name",
-            "pegMechanism",
-            "pegType",
-        ]:
-            if col not in merged_df.columns:
-                merged_df[col] = None
-
         # Rename columns for display
         rename_mapping = {
             "chain": "Chain",
@@ -349,18 +313,25 @@ def get_analytics_data(
                 f"Pool Analytics data: Dropped {dropped_rows} rows with missing APY or TVL_USD."
             )
 
-        # Ensure string columns have proper values
+        # Fill missing and empty strings with "N/A" in one pass over all string columns and
+        # store them as categoricals for grouping
         str_cols = [
-            "Project",
-            "Chain",
-            "Type (Peg)",
-            "Type (Peg Mechanism)",
-            "Issuer/Name",
-            "Asset Symbol",
+            col
+            for col in [
+                "Project",
+                "Chain",
+                "Type (Peg)",
+                "Type (Peg Mechanism)",
+                "Issuer/Name",
+                "Asset Symbol",
+            ]
+            if col in analytics_df.columns
         ]
-        for col in str_cols:
-            if col in analytics_df.columns:
-                analytics_df[col] = analytics_df[col].astype(str).fillna("N/A").replace("", "N/A")
+        if str_cols:
+            str_values = analytics_df[str_cols].astype("string")
+            analytics_df[str_cols] = str_values.mask(
+                str_values.isna() | (str_values == ""), "N/A"
+            ).astype("category")
 
         # Ensure all necessary columns are present
         final_analytics_columns = [
@@ -391,13 +362,106 @@ def get_analytics_data(
 
     except Exception as e:
         handle_api_error(e, "Error processing analytics data", logging.ERROR, show_traceback=True)
-        return error_return
+        return create_error_dataframe("error", "Data fetch failed")
+
+
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: dataframe_fingerprint})
+def get_filter_options(df: pd.DataFrame, column: str) -> List[Any]:
+    """
+    Returns the sorted distinct non-null values of a column for a filter dropdown.
+
+    Cached per DataFrame content so widget reruns do not re-scan and re-sort the column.
+    Categorical columns are resolved from their codes instead of the string values.
+
+    Args:
+        df: DataFrame holding the column
+        column: Column to collect options from
+
+    Returns:
+        Sorted list of distinct values
+    """
+    values = df[column]
 
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        observed_codes = np.unique(values.cat.codes.to_numpy())
+        return sorted(values.cat.categories[observed_codes[observed_codes >= 0]])
+
+    return sorted(values.dropna().unique())
+
+
+@st.cache_data(
+    ttl=CACHE_TTL_MEDIUM,
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: stamped_dataframe_key},
+)
+def get_yield_filter_options(
+    min_tvl: float,
+    target_yield_assets_lower: Collection[str],
+    stablecoin_metadata_df: Optional[pd.DataFrame],
+    yield_pools_df: Optional[pd.DataFrame],
+) -> Dict[str, List[Any]]:
+    """
+    Collects the Pool Yields dropdown options (Project, Type (Peg)) once per data load.
+
+    Cached with the same arguments as get_yield_data so widget reruns reuse the lists
+    instead of fingerprinting the table for each column.
+
+    Args:
+        min_tvl: Minimum TVL filter value
+        target_yield_assets_lower: Collection of target yield asset symbols (lowercase)
+        stablecoin_metadata_df: DataFrame with stablecoin metadata
+        yield_pools_df: DataFrame with the yield pools
+
+    Returns:
+        Dictionary mapping each filter column to its sorted options (empty if data is unavailable)
+    """
+    yield_df = get_yield_data(
+        min_tvl, target_yield_assets_lower, stablecoin_metadata_df, yield_pools_df
+    )
+
+    if yield_df.empty or get_dataframe_status(yield_df) is not None:
+        return {}
+
+    return {
+        column: get_filter_options(yield_df, column)
+        for column in ["Project", "Type (Peg)"]
+        if column in yield_df.columns
+    }
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_stablecoin_yields_filter_options(
+    manual_stablecoin_data: Dict[str, Dict[str, str]],
+) -> Dict[str, List[Any]]:
+    """
+    Collects the Stablecoin Yields dropdown options (Project, Strategy Type) once per data load.
 
+    Cached with the same argument as get_stablecoin_yields_data.
+
+    Args:
+        manual_stablecoin_data: Dictionary of manual stablecoin data
+
+    Returns:
+        Dictionary mapping each filter column to its sorted options (empty if data is unavailable)
+    """
+    yields_df = get_stablecoin_yields_data(manual_stablecoin_data)
+
+    if yields_df.empty or get_dataframe_status(yields_df) is not None:
+        return {}
+
+    return {
+        column: get_filter_options(yields_df, column)
+        for column in ["Project", "Strategy Type"]
+        if column in yields_df.columns
+    }
+
+
+@st.cache_data(ttl=3600)
 def get_enhanced_analytics_data(manual_stablecoin_data: Dict[str, Dict[str, str]]) -> pd.DataFrame:
     """
     Generates data for the Stablecoin Analytics plots based on manually-defined stablecoin yield data.
-    Parses yield and TVL strings into numeric formats.
+    Parses yield and TVL strings into numeric formats. Cached like get_stablecoin_yields_data,
+    since the manual data only changes with a deploy.
 
     Args:
         manual_stablecoin_data: Dictionary of manual stablecoin data
@@ -410,9 +474,7 @@ def get_enhanced_analytics_data(manual_stablecoin_data: Dict[str, Dict[str, str]
     try:
         manual_yield_data = get_stablecoin_yields_data(manual_stablecoin_data)
 
-        if isinstance(manual_yield_data, pd.DataFrame) and (
-            "warning" in manual_yield_data.columns or "error" in manual_yield_data.columns
-        ):
+        if get_dataframe_status(manual_yield_data) is not None:
             logging.error(
                 "get_enhanced_analytics_data: Could not retrieve valid manual yield data."
             )
@@ -423,27 +485,18 @@ def get_enhanced_analytics_data(manual_stablecoin_data: Dict[str, Dict[str, str]
             return create_error_dataframe("warning", "Manual source data is empty")
 
         # Process the data
-        analytics_df = manual_yield_data.copy()
-        analytics_df.rename(columns={"Ticker": "Asset Symbol"}, inplace=True)
-
-        # Apply transformations in batches for better performance
-        def parse_yield_batch(batch: pd.DataFrame) -> pd.DataFrame:
-            batch["APY"] = batch["Yield"].apply(parse_yield)
-            return batch
-
-        def parse_tvl_batch(batch: pd.DataFrame) -> pd.DataFrame:
-            batch["TVL_USD"] = batch["TVL"].apply(parse_tvl)
-            return batch
-
-        # Apply batched processing
-        analytics_df = batch_process_dataframe(analytics_df, parse_yield_batch)
-        analytics_df = batch_process_dataframe(analytics_df, parse_tvl_batch)
-
-        # Categorize by strategy
-        logging.info("Categorizing strategies based on manual descriptions...")
-        analytics_df["Strategy Type"] = parallel_apply(
-            analytics_df, categorize_stablecoin_by_strategy, "Description"
-        )
+        analytics_df = manual_yield_data.rename(columns={"Ticker": "Asset Symbol"})
+
+        # Parse the display strings into numeric columns with vectorized string operations
+        analytics_df["APY"] = parse_yield_series(analytics_df["Yield"])
+        analytics_df["TVL_USD"] = parse_tvl_series(analytics_df["TVL"])
+
+        # Categorize by strategy unless the yields table already did
+        if "Strategy Type" not in analytics_df.columns:
+            logging.info("Categorizing strategies based on manual descriptions...")
+            analytics_df["Strategy Type"] = parallel_apply(
+                analytics_df, categorize_stablecoin_by_strategy, "Description"
+            )
 
         # Ensure all necessary columns are present
         final_columns = [
@@ -460,11 +513,11 @@ def get_enhanced_analytics_data(manual_stablecoin_data: Dict[str, Dict[str, str]
             if col not in analytics_df.columns:
                 analytics_df[col] = None
 
-        enhanced_df = analytics_df[final_columns].copy()
+        enhanced_df = analytics_df[final_columns]
 
         # Remove rows with missing APY or TVL
         initial_rows_enhanced = len(enhanced_df)
-        enhanced_df.dropna(subset=["APY", "TVL_USD"], inplace=True)
+        enhanced_df = enhanced_df.dropna(subset=["APY", "TVL_USD"])
         dropped_rows_enhanced = initial_rows_enhanced - len(enhanced_df)
 
         if dropped_rows_enhanced > 0:
@@ -472,11 +525,18 @@ def get_enhanced_analytics_data(manual_stablecoin_data: Dict[str, Dict[str, str]
                 f"Enhanced Analytics (Manual): Dropped {dropped_rows_enhanced} rows with missing numeric APY or TVL_USD."
             )
 
-        # Ensure string columns have proper values
-        str_cols = ["Project", "Asset Symbol", "Description", "Strategy Type"]
-        for col in str_cols:
-            if col in enhanced_df.columns:
-                enhanced_df[col] = enhanced_df[col].astype(str).fillna("N/A").replace("", "N/A")
+        # Ensure string columns have proper values, masking missing and empty strings in one
+        # pass over all of them (kept as object columns for optimize_dataframe)
+        str_cols = [
+            col
+            for col in ["Project", "Asset Symbol", "Description", "Strategy Type"]
+            if col in enhanced_df.columns
+        ]
+        if str_cols:
+            str_values = enhanced_df[str_cols].astype("string")
+            enhanced_df[str_cols] = str_values.mask(
+                str_values.isna() | (str_values == ""), "N/A"
+            ).astype(object)
 
         # Optimize memory usage
         enhanced_df = optimize_dataframe(enhanced_df)
@@ -494,6 +554,33 @@ def get_enhanced_analytics_data(manual_stablecoin_data: Dict[str, Dict[str, str]
         return create_error_dataframe("error", "Failed to process enhanced analytics data")
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_strategy_aggregates(manual_stablecoin_data: Dict[str, Dict[str, str]]) -> pd.DataFrame:
+    """
+    Counts stablecoins and averages APY per strategy type over the Stablecoin Analytics data.
+
+    Cached with the same argument as get_enhanced_analytics_data so reruns skip the groupby.
+
+    Args:
+        manual_stablecoin_data: Dictionary of manual stablecoin data
+
+    Returns:
+        DataFrame with Strategy Type, Count and MeanAPY columns (empty if analytics data is
+        unavailable)
+    """
+    enhanced_df = get_enhanced_analytics_data(manual_stablecoin_data)
+
+    if enhanced_df.empty or get_dataframe_status(enhanced_df) is not None:
+        return pd.DataFrame(columns=["Strategy Type", "Count", "MeanAPY"])
+
+    return (
+        enhanced_df.groupby("Strategy Type", observed=True)
+        .agg(Count=("APY", "size"), MeanAPY=("APY", "mean"))
+        .sort_values("Count", ascending=False)
+        .reset_index()
+    )
+
+
 @st.cache_data(ttl=3600)
 def get_stablecoin_yields_data(manual_stablecoin_data: Dict[str, Dict[str, str]]) -> pd.DataFrame:
     """
@@ -503,50 +590,60 @@ def get_stablecoin_yields_data(manual_stablecoin_data: Dict[str, Dict[str, str]]
         manual_stablecoin_data: Dictionary of manual stablecoin data
 
     Returns:
-        DataFrame with processed manual stablecoin data
+        DataFrame with processed manual stablecoin data, including the derived Strategy Type
     """
     logging.info("Starting get_stablecoin_yields_data (using manual data)...")
 
     try:
-        rows = []
-        for key, data in manual_stablecoin_data.items():
-            rows.append(
-                {
-                    "Project": data.get("Project", "N/A"),
-                    "Ticker": data.get("Ticker", key.upper()),
-                    "Yield": data.get("Yield", "N/A"),
-                    "TVL": data.get("TVL", "N/A"),
-                    "Description": data.get("Description", "N/A"),
-                    "Staked Proportion": format_staked_proportion(
-                        data.get("StakedProportion", "N/A")
-                    ),
-                    "Yield_sort": parse_yield(data.get("Yield", "N/A")),
-                }
-            )
+        # Build the table from the dict of dicts in one call; absent fields become NaN and are
+        # cleaned up to "N/A" below
+        source_df = pd.DataFrame.from_dict(manual_stablecoin_data, orient="index")
 
-        if not rows:
+        if source_df.empty:
             logging.warning("Manual stablecoin data is empty.")
             return create_error_dataframe("warning", "Manual stablecoin data is empty")
 
-        result_df = pd.DataFrame(rows)
+        required_cols = [
+            "Project",
+            "Ticker",
+            "Yield",
+            "TVL",
+            "Description",
+            "Staked Proportion",
+            "Strategy Type",
+            "_ticker_lc",
+        ]
+        result_df = source_df.reindex(
+            columns=["Project", "Ticker", "Yield", "TVL", "Description", "StakedProportion"]
+        ).rename(columns={"StakedProportion": "Staked Proportion"})
+
+        # Tickers default to the upper-cased data key
+        result_df["Ticker"] = result_df["Ticker"].fillna(
+            pd.Series(result_df.index.str.upper(), index=result_df.index)
+        )
+        result_df["Staked Proportion"] = result_df["Staked Proportion"].map(
+            format_staked_proportion
+        )
+        result_df = result_df.reset_index(drop=True)
 
         # Sort by yield
-        result_df = result_df.sort_values("Yield_sort", ascending=False, na_position="last")
-        result_df = result_df.drop(columns=["Yield_sort"])
+        result_df = result_df.sort_values(
+            "Yield", key=parse_yield_series, ascending=False, na_position="last"
+        )
 
-        # Clean up any NA values
-        for col in result_df.columns:
-            result_df[col] = result_df[col].replace(["", "?", None, np.nan], "N/A")
+        # Clean up any NA values with one frame-wide mask
+        result_df = result_df.where(result_df.notna() & ~result_df.isin(["", "?"]), "N/A")
 
-        # Ensure all required columns are present
-        required_cols = ["Project", "Ticker", "Yield", "TVL", "Description", "Staked Proportion"]
-        for col in required_cols:
-            if col not in result_df.columns:
-                result_df[col] = "N/A"
-                logging.warning(f"Added missing required column: {col}")
+        # Categorize once here so pages filtering on it reuse the cached column
+        result_df["Strategy Type"] = result_df["Description"].map(categorize_stablecoin_by_strategy)
 
-        # Optimize memory usage
+        # Hidden lowercased ticker for the page's "contains" filter
+        result_df["_ticker_lc"] = result_df["Ticker"].str.lower()
+
+        # Optimize memory usage; the filter columns are always categorical so option lists and
+        # equality filters work on the category codes
         result_df = optimize_dataframe(result_df)
+        result_df = result_df.astype({"Project": "category", "Strategy Type": "category"})
 
         logging.info(f"get_stablecoin_yields_data: Returning {len(result_df)} manual rows.")
 
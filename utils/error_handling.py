@@ -125,7 +125,7 @@ def create_error_dataframe(
         details: Optional dictionary of additional error details
 
     Returns:
-        DataFrame with error information
+        DataFrame with error information, tagged with its error type in ``attrs["status"]``
     """
     error_data = {error_type: [message]}
 
@@ -133,7 +133,27 @@ def create_error_dataframe(
         for key, value in details.items():
             error_data[f"{error_type}_{key}"] = [value]
 
-    return pd.DataFrame(error_data)
+    error_df = pd.DataFrame(error_data)
+    error_df.attrs["status"] = error_type
+    return error_df
+
+
+def get_dataframe_status(df: Any) -> Optional[str]:
+    """
+    Get the error type of a DataFrame created by create_error_dataframe.
+
+    Reads the tag set by create_error_dataframe instead of looking for status column names, so
+    a data column that happens to be called 'error' or 'warning' is not mistaken for a status.
+
+    Args:
+        df: Value returned by a data processing function
+
+    Returns:
+        Error type (e.g., 'error', 'warning', 'warning_tvl'), or None for regular data
+    """
+    if isinstance(df, pd.DataFrame):
+        return df.attrs.get("status")
+    return None
 
 
 def safe_execute(
@@ -33,6 +33,13 @@ def format_metadata(value):
     return value if pd.notna(value) and value != "" else "N/A"
 
 
+def format_metadata_series(values):
+    """Vectorized format_metadata: replaces NaN, None and empty strings with 'N/A'."""
+    if isinstance(values.dtype, pd.CategoricalDtype) and "N/A" not in values.cat.categories:
+        values = values.cat.add_categories("N/A")
+    return values.where(values.notna() & (values != ""), "N/A")
+
+
 def format_staked_proportion(value):
     """Handles specific formatting for staked proportion, treating '?' and empty strings as N/A."""
     if pd.isna(value) or value in ["", "?"]:
@@ -74,6 +81,30 @@ def parse_tvl(tvl_str):
         return np.nan
 
 
+# Multipliers for the B/M/K suffixes understood by parse_tvl
+_TVL_SUFFIX_MULTIPLIERS = {"b": 1_000_000_000, "m": 1_000_000, "k": 1_000}
+
+
+def parse_yield_series(yield_strs):
+    """Vectorized parse_yield for a Series of 'X.XX%' strings; non-strings parse to NaN."""
+    cleaned = yield_strs.astype(object).str.strip().str.replace("%", "", regex=False)
+    return pd.to_numeric(cleaned, errors="coerce").astype(float)
+
+
+def parse_tvl_series(tvl_strs):
+    """Vectorized parse_tvl for a Series of '$X.XX[B/M/K]' strings; non-strings parse to NaN."""
+    cleaned = (
+        tvl_strs.astype(object)
+        .str.strip()
+        .str.replace("$", "", regex=False)
+        .str.replace(",", "", regex=False)
+        .str.lower()
+    )
+    multiplier = cleaned.str[-1:].map(_TVL_SUFFIX_MULTIPLIERS)
+    number = cleaned.where(multiplier.isna(), cleaned.str[:-1])
+    return pd.to_numeric(number, errors="coerce").astype(float) * multiplier.fillna(1).to_numpy()
+
+
 def categorize_stablecoin_by_strategy(desc):
     """Categorizes stablecoins based on their yield strategies from description text."""
     desc = str(desc).lower()
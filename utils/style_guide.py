@@ -5,6 +5,7 @@ This module defines standard formatting and style patterns to ensure
 consistency across the application.
 """
 
+import functools
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import streamlit as st
@@ -67,8 +68,12 @@ DEFAULT_COLUMN_CONFIGS = {
     "Chain": st.column_config.TextColumn("Chain", help="Blockchain where the pool is deployed"),
     "Project": st.column_config.TextColumn("Project", help="Project name or protocol"),
     "Asset Symbol": st.column_config.TextColumn("Asset Symbol", help="Token symbol"),
-    "APY (%)": st.column_config.TextColumn("APY (%)", help="Annual Percentage Yield"),
-    "TVL (USD)": st.column_config.TextColumn("TVL (USD)", help="Total Value Locked in USD"),
+    "APY (%)": st.column_config.NumberColumn(
+        "APY (%)", help="Annual Percentage Yield", format="%.2f%%"
+    ),
+    "TVL (USD)": st.column_config.NumberColumn(
+        "TVL (USD)", help="Total Value Locked in USD", format="dollar"
+    ),
     "Issuer/Name": st.column_config.TextColumn("Issuer/Name", help="Token issuer or name"),
     "Type (Peg)": st.column_config.TextColumn("Type (Peg)", help="Peg type (e.g., USD, EUR)"),
     "Type (Peg Mechanism)": st.column_config.TextColumn(
@@ -116,6 +121,9 @@ def get_default_plot_layout(
     """
     Get default plot layout configuration for consistent styling.
 
+    The returned dictionary is cached and shared between calls, so it must
+    not be mutated.
+
     Args:
         title: Plot title
         x_axis_title: X-axis title
@@ -126,7 +134,35 @@ def get_default_plot_layout(
     Returns:
         Dictionary with layout configuration
     """
-    colors = get_color_palette()
+    is_dark_theme = get_color_palette() is DARK_COLOR_PALETTE
+    return _build_plot_layout(title, x_axis_title, y_axis_title, show_legend, height, is_dark_theme)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_plot_layout(
+    title: str,
+    x_axis_title: Optional[str],
+    y_axis_title: Optional[str],
+    show_legend: bool,
+    height: Optional[int],
+    is_dark_theme: bool,
+) -> Dict[str, Any]:
+    """
+    Build the default plot layout for a given set of arguments and theme.
+
+    Args:
+        title: Plot title
+        x_axis_title: X-axis title
+        y_axis_title: Y-axis title
+        show_legend: Whether to show the legend
+        height: Plot height in pixels
+        is_dark_theme: Whether the dark color palette is active
+
+    Returns:
+        Dictionary with layout configuration
+    """
+    colors = DARK_COLOR_PALETTE if is_dark_theme else LIGHT_COLOR_PALETTE
+    grid_color = "#555555" if is_dark_theme else "#EEEEEE"
 
     return {
         "title": title,
@@ -139,17 +175,15 @@ def get_default_plot_layout(
         },
         "title_font": {"size": SIZING["font_size_large"], "color": colors["text"]},
         "xaxis": {
-            "title": x_axis_title,
+            "title": {"text": x_axis_title, "font": {"color": colors["text"]}},
             "showgrid": True,
-            "gridcolor": "#555555" if colors == DARK_COLOR_PALETTE else "#EEEEEE",
-            "titlefont": {"color": colors["text"]},
+            "gridcolor": grid_color,
             "tickfont": {"color": colors["text"]},
         },
         "yaxis": {
-            "title": y_axis_title,
+            "title": {"text": y_axis_title, "font": {"color": colors["text"]}},
             "showgrid": True,
-            "gridcolor": "#555555" if colors == DARK_COLOR_PALETTE else "#EEEEEE",
-            "titlefont": {"color": colors["text"]},
+            "gridcolor": grid_color,
             "tickfont": {"color": colors["text"]},
         },
         "showlegend": show_legend,
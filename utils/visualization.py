@@ -5,11 +5,28 @@ Visualization utilities for the stablecoin dashboard.
 import logging
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
 
+from utils.caching import dataframe_fingerprint
+from utils.config import SCATTER_BINNING_THRESHOLD, SCATTER_BINS
 
+# Serialize figures with orjson when available (handles numpy arrays and NaN natively)
+try:
+    import orjson  # noqa: F401
+
+    pio.json.config.default_engine = "orjson"
+except ImportError:
+    pass
+
+
+# Figure builders are cached on a fingerprint of their input so reruns triggered by unrelated
+# widgets reuse the finished figure instead of rebuilding every trace
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: dataframe_fingerprint})
 def create_top_yield_plot(
     df: pd.DataFrame,
     top_n: int = 20,
@@ -46,29 +63,58 @@ def create_top_yield_plot(
     try:
         # Select top n assets by APY
         top_n_yield = min(top_n, len(df))
-        top_yield_df = df.nlargest(top_n_yield, "APY")
+        top_yield_df = _top_n(df, "APY", top_n_yield)
 
         if top_yield_df.empty:
             logging.warning("Not enough data to display top stablecoins by yield.")
             return go.Figure()
 
         color_col = color_column if color_column in top_yield_df.columns else None
-        hover_cols = [col for col in (hover_data_columns or []) if col in top_yield_df.columns]
-
-        fig = px.bar(
-            top_yield_df.sort_values("APY", ascending=True),
-            x="APY",
-            y="Asset Symbol",
-            orientation="h",
-            title=f"Top {top_n_yield} Stablecoins by Yield",
-            labels={"APY": "Annual Percentage Yield (%)", "Asset Symbol": "Asset Symbol"},
-            text="APY",
-            color=color_col,
-            hover_data=hover_cols,
+        hover_cols = [
+            col
+            for col in (hover_data_columns or [])
+            if col in top_yield_df.columns and col not in ("APY", "Asset Symbol", color_col)
+        ]
+
+        # Build the bar traces directly from arrays (one per color group, as px.bar would)
+        # instead of paying px.bar's DataFrame introspection for this fixed-shape chart
+        hover_template = "Annual Percentage Yield (%)=%{x:.2f}%<br>Asset Symbol=%{y}"
+        hover_template += "".join(
+            f"<br>{col}=%{{customdata[{i}]}}" for i, col in enumerate(hover_cols)
         )
 
-        fig.update_traces(texttemplate="%{text:.2f}%", textposition="outside")
+        if color_col:
+            group_values = top_yield_df[color_col].to_numpy()
+            groups = [(str(value), group_values == value) for value in pd.unique(group_values)]
+        else:
+            groups = [("", np.ones(len(top_yield_df), dtype=bool))]
+
+        colorway = _template_colorway()
+        fig = go.Figure()
+        for i, (group_name, group_mask) in enumerate(groups):
+            group_df = top_yield_df[group_mask]
+            group_hover = f"{color_col}={group_name}<br>" if color_col else ""
+            fig.add_trace(
+                go.Bar(
+                    x=group_df["APY"].to_numpy(),
+                    y=group_df["Asset Symbol"].to_numpy(),
+                    text=group_df["APY"].to_numpy(),
+                    customdata=group_df[hover_cols].to_numpy() if hover_cols else None,
+                    orientation="h",
+                    name=group_name,
+                    legendgroup=group_name,
+                    showlegend=bool(color_col),
+                    marker_color=colorway[i % len(colorway)],
+                    texttemplate="%{text:.2f}%",
+                    textposition="outside",
+                    hovertemplate=group_hover + hover_template + "<extra></extra>",
+                )
+            )
+
         fig.update_layout(
+            title=f"Top {top_n_yield} Stablecoins by Yield",
+            barmode="relative",
+            legend_tracegroupgap=0,
             yaxis_title="Asset Symbol",
             xaxis_title="Annual Percentage Yield (%)",
             uniformtext_minsize=8,
@@ -88,12 +134,17 @@ def create_top_yield_plot(
         return fig
 
 
-def create_strategy_distribution_pie(df: pd.DataFrame) -> go.Figure:
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: dataframe_fingerprint})
+def create_strategy_distribution_pie(
+    df: pd.DataFrame, strategy_agg: Optional[pd.DataFrame] = None
+) -> go.Figure:
     """
     Creates a pie chart showing distribution of stablecoins by strategy type.
 
     Args:
         df: DataFrame containing the data
+        strategy_agg: Optional precomputed per-strategy aggregates (Strategy Type, Count,
+            MeanAPY); counted from df when not provided
 
     Returns:
         Plotly figure object
@@ -114,8 +165,15 @@ def create_strategy_distribution_pie(df: pd.DataFrame) -> go.Figure:
         return fig
 
     try:
-        strategy_counts = df["Strategy Type"].value_counts().reset_index()
-        strategy_counts.columns = ["Strategy Type", "Count"]
+        if strategy_agg is not None:
+            strategy_counts = strategy_agg[["Strategy Type", "Count"]]
+        else:
+            strategy_counts = (
+                df.groupby("Strategy Type", observed=True)
+                .size()
+                .sort_values(ascending=False)
+                .reset_index(name="Count")
+            )
 
         if strategy_counts.empty:
             logging.warning("No strategy type data available.")
@@ -142,12 +200,17 @@ def create_strategy_distribution_pie(df: pd.DataFrame) -> go.Figure:
         return fig
 
 
-def create_avg_yield_by_strategy_plot(df: pd.DataFrame) -> go.Figure:
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: dataframe_fingerprint})
+def create_avg_yield_by_strategy_plot(
+    df: pd.DataFrame, strategy_agg: Optional[pd.DataFrame] = None
+) -> go.Figure:
     """
     Creates a bar chart showing average yield by strategy type.
 
     Args:
         df: DataFrame containing the data
+        strategy_agg: Optional precomputed per-strategy aggregates (Strategy Type, Count,
+            MeanAPY); grouped from df when not provided
 
     Returns:
         Plotly figure object
@@ -168,7 +231,14 @@ def create_avg_yield_by_strategy_plot(df: pd.DataFrame) -> go.Figure:
         return fig
 
     try:
-        strategy_avg_yield = df.groupby("Strategy Type")["APY"].mean().reset_index()
+        if strategy_agg is not None:
+            strategy_avg_yield = strategy_agg[["Strategy Type", "MeanAPY"]].rename(
+                columns={"MeanAPY": "APY"}
+            )
+        else:
+            strategy_avg_yield = (
+                df.groupby("Strategy Type", observed=True)["APY"].mean().reset_index()
+            )
         strategy_avg_yield = strategy_avg_yield.sort_values("APY", ascending=False)
 
         if strategy_avg_yield.empty:
@@ -200,6 +270,47 @@ def create_avg_yield_by_strategy_plot(df: pd.DataFrame) -> go.Figure:
         return fig
 
 
+def _create_tvl_vs_apy_heatmap(df: pd.DataFrame) -> go.Figure:
+    """
+    Creates a 2-D histogram of TVL (log bins) vs APY for frames too large to plot point by point.
+
+    Only the bin counts are sent to the browser instead of one marker per row.
+
+    Args:
+        df: DataFrame with numeric TVL_USD and APY columns
+
+    Returns:
+        Plotly figure object
+    """
+    tvl = df["TVL_USD"].to_numpy(dtype=float)
+    apy = df["APY"].to_numpy(dtype=float)
+    valid = (tvl > 0) & np.isfinite(tvl) & np.isfinite(apy)
+
+    counts, log_tvl_edges, apy_edges = np.histogram2d(
+        np.log10(tvl[valid]), apy[valid], bins=SCATTER_BINS
+    )
+    counts[counts == 0] = np.nan
+
+    fig = go.Figure(
+        go.Heatmap(
+            x=10 ** ((log_tvl_edges[:-1] + log_tvl_edges[1:]) / 2),
+            y=(apy_edges[:-1] + apy_edges[1:]) / 2,
+            z=counts.T,
+            colorscale="Viridis",
+            colorbar={"title": "Pools"},
+            hovertemplate="TVL: %{x:$,.3s}<br>APY: %{y:.2f}%<br>Pools: %{z}<extra></extra>",
+        )
+    )
+    fig.update_layout(
+        title=f"TVL vs. APY (Log Scale TVL, {int(valid.sum())} pools binned)",
+        xaxis_title="Total Value Locked (USD - Log Scale)",
+        yaxis_title="Annual Percentage Yield (%)",
+        xaxis_type="log",
+    )
+    return fig
+
+
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: dataframe_fingerprint})
 def create_tvl_vs_apy_scatter(
     df: pd.DataFrame,
     color_column: Optional[str] = "Strategy Type",
@@ -207,7 +318,8 @@ def create_tvl_vs_apy_scatter(
     hover_data_columns: Optional[List[str]] = None,
 ) -> go.Figure:
     """
-    Creates a scatter plot showing TVL vs APY for stablecoins.
+    Creates a scatter plot showing TVL vs APY for stablecoins. Frames with more than
+    SCATTER_BINNING_THRESHOLD rows are drawn as a binned heatmap instead.
 
     Args:
         df: DataFrame containing the data
@@ -241,17 +353,28 @@ def create_tvl_vs_apy_scatter(
             logging.warning("Not enough data points to display TVL vs APY scatter plot.")
             return go.Figure()
 
+        if len(df) > SCATTER_BINNING_THRESHOLD:
+            return _create_tvl_vs_apy_heatmap(df)
+
         color_col = color_column if color_column in df.columns else None
         hover_cols = [col for col in (hover_data_columns or []) if col in df.columns]
 
+        # Ship the numeric columns as float32 (half the bytes of float64 in the figure JSON) and
+        # format them in the hover so the narrower values never show
+        plot_df = df.assign(
+            TVL_USD=df["TVL_USD"].astype("float32"), APY=df["APY"].round(2).astype("float32")
+        )
+        hover_data = {col: True for col in hover_cols}
+        hover_data.update({"TVL_USD": ":$,.3s", "APY": ":.2f"})
+
         fig = px.scatter(
-            df,
+            plot_df,
             x="TVL_USD",
             y="APY",
             color=color_col,
             size="TVL_USD",
             hover_name=hover_name,
-            hover_data=hover_cols,
+            hover_data=hover_data,
             log_x=True,
             title="TVL vs. APY (Log Scale TVL)",
             labels={
@@ -274,6 +397,79 @@ def create_tvl_vs_apy_scatter(
         return fig
 
 
+def _quantiles(values: np.ndarray, qs: Tuple[float, ...]) -> Tuple[float, ...]:
+    """
+    Linear-interpolated quantiles (same as Series.quantile) using selection instead of a sort.
+
+    np.partition places only the order statistics needed for each quantile in linear time.
+
+    Args:
+        values: 1-D array without NaNs
+        qs: Quantiles to compute, each between 0 and 1
+
+    Returns:
+        Tuple of quantile values in the order of qs
+    """
+    last = values.size - 1
+    positions = [q * last for q in qs]
+    kth = sorted({min(int(pos) + step, last) for pos in positions for step in (0, 1)})
+    partitioned = np.partition(values, kth)
+
+    results = []
+    for pos in positions:
+        lower = int(pos)
+        upper = min(lower + 1, last)
+        frac = pos - lower
+        results.append(partitioned[lower] + (partitioned[upper] - partitioned[lower]) * frac)
+    return tuple(results)
+
+
+def _template_colorway() -> List[str]:
+    """
+    Discrete color sequence of the active Plotly template, with px's D3 fallback.
+
+    Returns:
+        List of colors assigned to traces in order
+    """
+    template = pio.templates[pio.templates.default] if pio.templates.default else None
+    if template is not None and template.layout.colorway:
+        return list(template.layout.colorway)
+    return list(px.colors.qualitative.D3)
+
+
+def _top_n(df: pd.DataFrame, column: str, n: int) -> pd.DataFrame:
+    """
+    Rows with the n largest values of a column, ordered ascending for horizontal bar charts.
+
+    Same rows as df.nlargest(n, column) (NaNs skipped, ties kept in row order), but the cut-off
+    value is found with np.partition in linear time instead of a sort.
+
+    Args:
+        df: DataFrame to select from
+        column: Numeric column to rank by
+        n: Number of rows to keep
+
+    Returns:
+        DataFrame with at most n rows, sorted by column ascending
+    """
+    values = df[column].to_numpy(dtype=float)
+    positions = np.flatnonzero(~np.isnan(values))
+    n = min(n, positions.size)
+    if n == 0:
+        return df.iloc[:0]
+
+    valid = values[positions]
+    cutoff_index = valid.size - n
+    cutoff = np.partition(valid, cutoff_index)[cutoff_index]
+
+    above = positions[valid > cutoff]
+    ties = positions[valid == cutoff][: n - above.size]
+    selected = np.sort(np.concatenate([above, ties]))
+    order = np.lexsort((selected, values[selected]))
+    return df.iloc[selected[order]]
+
+
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: dataframe_fingerprint})
 def create_apy_distribution_histogram(df: pd.DataFrame) -> go.Figure:
     """
     Creates a histogram showing the distribution of APYs.
@@ -304,16 +500,15 @@ def create_apy_distribution_histogram(df: pd.DataFrame) -> go.Figure:
 
         if len(apy_data_numeric) > 10:
             # Filter out extreme values that may skew the visualization
-            q_low = apy_data_numeric.quantile(0.01)
-            q_high = apy_data_numeric.quantile(0.99)
-            hist_data = df[(df["APY"] >= q_low) & (df["APY"] <= q_high)].copy()
+            q_low, q_high = _quantiles(apy_data_numeric.to_numpy(dtype=float), (0.01, 0.99))
+            hist_data = df[(df["APY"] >= q_low) & (df["APY"] <= q_high)]
             hist_title = "Distribution of Pool APYs (1st-99th Percentile)"
 
             if hist_data.empty:
-                hist_data = df.copy()
+                hist_data = df
                 hist_title = "Distribution of Pool APYs (All)"
         else:
-            hist_data = df.copy()
+            hist_data = df
             hist_title = "Distribution of Pool APYs (All)"
 
         if hist_data.empty:
@@ -343,6 +538,7 @@ def create_apy_distribution_histogram(df: pd.DataFrame) -> go.Figure:
         return fig
 
 
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: dataframe_fingerprint})
 def create_top_projects_by_tvl(df: pd.DataFrame, top_n: int = 10) -> go.Figure:
     """
     Creates a horizontal bar chart showing top projects by TVL.
@@ -370,15 +566,15 @@ def create_top_projects_by_tvl(df: pd.DataFrame, top_n: int = 10) -> go.Figure:
         return fig
 
     try:
-        project_tvl = df.groupby("Project")["TVL_USD"].sum().reset_index()
-        top_n_tvl_projects = project_tvl.nlargest(top_n, "TVL_USD")
+        project_tvl = df.groupby("Project", observed=True)["TVL_USD"].sum().reset_index()
+        top_n_tvl_projects = _top_n(project_tvl, "TVL_USD", top_n)
 
         if top_n_tvl_projects.empty:
             logging.warning(f"Could not determine Top {top_n} Projects by TVL.")
             return go.Figure()
 
         fig = px.bar(
-            top_n_tvl_projects.sort_values("TVL_USD", ascending=True),
+            top_n_tvl_projects,
             x="TVL_USD",
             y="Project",
             orientation="h",